@@ -3,6 +3,10 @@ Módulo de utilidades para lectura y escritura de archivos.
 Maneja el formato de entrada/salida del problema de riego óptimo.
 """
 
+import warnings
+
+import numpy as np
+
 
 def leer_finca(ruta_archivo):
     """
@@ -62,6 +66,53 @@ def leer_finca(ruta_archivo):
         raise Exception(f"Error al leer el archivo: {str(e)}")
 
 
+def leer_finca_columnas(ruta_archivo):
+    """
+    Lee el archivo de entrada directamente como columnas NumPy, sin crear
+    una lista por tablón (pensado para fincas de millones de tablones).
+
+    Mismo formato y validaciones que leer_finca.
+
+    Args:
+        ruta_archivo (str o Path): Ruta al archivo de entrada
+
+    Returns:
+        tuple: (ts, tr, p) como arreglos int64 de largo n
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el formato del archivo es incorrecto
+    """
+    try:
+        with open(ruta_archivo, "r") as f:
+            primera = f.readline().strip()
+            if not primera:
+                raise ValueError("El archivo está vacío")
+            n = int(primera)
+            try:
+                # Sin filas loadtxt avisa con un UserWarning; ese caso se reporta abajo
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)
+                    datos = np.loadtxt(f, dtype=np.int64, delimiter=",", max_rows=n, ndmin=2)
+            except ValueError as e:
+                raise ValueError(f"Se esperaban 3 enteros separados por comas en cada línea: {e}")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No se encontró el archivo: {ruta_archivo}")
+
+    if n == 0 or datos.size == 0:
+        datos = np.zeros((0, 3), dtype=np.int64)
+    if len(datos) < n:
+        raise ValueError(f"Se esperaban {n} tablones pero solo hay {len(datos)} líneas")
+    if datos.shape[1] != 3:
+        raise ValueError("Se esperaban 3 valores separados por comas en cada línea")
+
+    ts, tr, p = datos[:, 0], datos[:, 1], datos[:, 2]
+    if (ts < 0).any() or (tr < 0).any() or (p < 1).any() or (p > 4).any():
+        raise ValueError("Valores fuera de rango (ts≥0, tr≥0, 1≤p≤4)")
+
+    return ts, tr, p
+
+
 def escribir_salida(ruta_archivo, perm, costo):
     """
     Escribe el resultado en el archivo de salida.
@@ -0,0 +1,102 @@
+import heapq
+
+from project1_ada2.dominancia import precedencias as calcular_precedencias
+from project1_ada2.irrigation_planks_rov import roPV
+
+
+def cota_restante(finca, mask, tiempo):
+    """
+    Cota inferior del costo de los tablones que faltan por regar.
+
+    Cada tablón pendiente termina, como pronto, en tiempo + tr, así que nunca
+    paga menos que p * max(0, tiempo + tr - ts). La cota es consistente: al
+    regar j se paga exactamente su término y los demás solo pueden crecer.
+    """
+    cota = 0
+    for i, (ts, tr, p) in enumerate(finca):
+        if not mask >> i & 1:
+            cota += p * max(0, tiempo + tr - ts)
+    return cota
+
+
+def roAE(finca, reporte=False, precedencias=False):
+    """
+    Búsqueda exacta mejor-primero (A*) sobre conjuntos de tablones regados.
+
+    Parte del conjunto vacío y expande siempre el estado con menor
+    costo acumulado + cota_restante. El estado es la máscara de regados (el
+    tiempo queda determinado por ella), y un conjunto de cerrados por máscara
+    evita expandir dos veces el mismo estado. El costo de roPV sirve de cota
+    superior: no se generan estados cuya estimación la supere. Como la cota
+    es consistente, el primer estado completo que sale de la cola es óptimo.
+
+    Con precedencias=True solo se riega un tablón cuando ya están regados sus
+    predecesores en el DAG de dominancia.precedencias.
+
+    Con reporte=True retorna además un diccionario con los estados
+    expandidos, los generados y los 2^n que recorre roPD, para comparar.
+
+    Retorna: (mejor_perm, mejor_costo) o (mejor_perm, mejor_costo, reporte)
+    """
+    n = len(finca)
+    completo = (1 << n) - 1
+    predecesores = calcular_precedencias(finca) if precedencias else [0] * n
+
+    cota_superior = roPV(finca)[1]
+
+    # Entradas (estimación, -regados, costo, máscara, tiempo): ante empates en
+    # la estimación se prefiere el estado más profundo. padres[mask] = (previa, i)
+    abiertos = [(cota_restante(finca, 0, 0), 0, 0, 0, 0)]
+    mejor_costo = {0: 0}
+    padres = {}
+    cerrados = set()
+    expandidos = 0
+    generados = 1
+
+    while abiertos:
+        _, regados, costo, mask, tiempo = heapq.heappop(abiertos)
+        if mask in cerrados:
+            continue
+        cerrados.add(mask)
+
+        if mask == completo:
+            break
+        expandidos += 1
+
+        for i, (ts, tr, p) in enumerate(finca):
+            if mask >> i & 1 or predecesores[i] & ~mask:
+                continue
+            nueva = mask | (1 << i)
+            if nueva in cerrados:
+                continue
+
+            nuevo_tiempo = tiempo + tr
+            nuevo_costo = costo + p * max(0, nuevo_tiempo - ts)
+            if nuevo_costo >= mejor_costo.get(nueva, float('inf')):
+                continue
+
+            estimacion = nuevo_costo + cota_restante(finca, nueva, nuevo_tiempo)
+            if estimacion > cota_superior:
+                continue
+
+            mejor_costo[nueva] = nuevo_costo
+            padres[nueva] = (mask, i)
+            heapq.heappush(abiertos, (estimacion, regados - 1, nuevo_costo, nueva, nuevo_tiempo))
+            generados += 1
+
+    # Reconstrucción desde el estado completo
+    mejor_perm = []
+    mask = completo
+    while mask:
+        mask, i = padres[mask]
+        mejor_perm.append(i)
+    mejor_perm.reverse()
+
+    if reporte:
+        return mejor_perm, mejor_costo[completo], {
+            "expandidos": expandidos,
+            "generados": generados,
+            "estados_totales": 1 << n,
+        }
+
+    return mejor_perm, mejor_costo[completo]
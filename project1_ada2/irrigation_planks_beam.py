@@ -0,0 +1,106 @@
+import numpy as np
+
+
+def roBeam(finca, ancho=16):
+    """
+    Búsqueda en haz: construye el orden de adelante hacia atrás conservando
+    en cada profundidad los `ancho` mejores órdenes parciales.
+
+    Cada candidato (estado, siguiente tablón) se puntúa con su costo
+    acumulado más la cota de cota_restante (irrigation_planks_astar) sobre
+    los tablones que quedan. Dos órdenes parciales con el mismo conjunto de
+    regados terminan en el mismo instante y tienen la misma cota, así que
+    solo se conserva el de menor costo acumulado.
+
+    Con ancho=1 es un voraz con anticipación; si `ancho` alcanza el número de
+    conjuntos de la capa más ancha, C(n, n/2), se recorren todos los estados
+    de roPD y el resultado es óptimo. Entre ambos extremos se cambia tiempo
+    por calidad en fincas demasiado grandes para roPD.
+
+    La cota de todos los candidatos de una profundidad se evalúa a la vez:
+    con los tablones ordenados por ts - tr, los pendientes que pagan en un
+    instante T son un prefijo, y la cota es T·Σp + Σp·(tr - ts) sobre ese
+    prefijo. Cada profundidad cuesta O(ancho · n log n).
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    if ancho < 1:
+        raise ValueError("ancho debe ser al menos 1")
+    n = len(finca)
+    if n == 0:
+        return [], 0
+
+    datos = np.array(finca, dtype=np.int64).reshape(n, 3)
+    orden_clave = np.argsort(datos[:, 0] - datos[:, 1], kind="stable")
+    ts, tr, p = (datos[orden_clave, k] for k in range(3))
+    clave = ts - tr
+    peso_tardanza = p * (tr - ts)
+    tr_distintos, tr_inverso = np.unique(tr, return_inverse=True)
+    infinito = np.iinfo(np.int64).max
+
+    # Haz inicial: solo el conjunto vacío (índices en el orden por clave)
+    pendientes = np.ones((1, n), dtype=bool)
+    tiempo = np.zeros(1, dtype=np.int64)
+    costo = np.zeros(1, dtype=np.int64)
+    mascaras = [0]
+    padres = []
+
+    for _ in range(n):
+        instante = tiempo[:, None] + tr[None, :]
+        nuevo_costo = costo[:, None] + p * np.maximum(0, instante - ts)
+
+        suma_p = np.zeros((len(mascaras), n + 1), dtype=np.int64)
+        suma_q = np.zeros((len(mascaras), n + 1), dtype=np.int64)
+        np.cumsum(pendientes * p, axis=1, out=suma_p[:, 1:])
+        np.cumsum(pendientes * peso_tardanza, axis=1, out=suma_q[:, 1:])
+        # El prefijo solo depende de tiempo + tr: se busca una vez por tr distinto
+        prefijo = np.searchsorted(clave, tiempo[:, None] + tr_distintos, side="left")
+        prefijo = prefijo[:, tr_inverso] + (n + 1) * np.arange(len(mascaras))[:, None]
+        cota = (instante * suma_p.ravel()[prefijo]
+                + suma_q.ravel()[prefijo]
+                - p * np.maximum(0, instante + tr - ts))
+
+        puntaje = np.where(pendientes, nuevo_costo + cota, infinito)
+
+        # Una máscara aparece a lo sumo una vez por estado del haz, así que
+        # entre los ancho² mejores candidatos hay `ancho` máscaras distintas
+        plano = puntaje.ravel()
+        candidatos = min(plano.size, ancho * ancho)
+        if candidatos < plano.size:
+            mejores = np.argpartition(plano, candidatos - 1)[:candidatos]
+        else:
+            mejores = np.arange(plano.size)
+        mejores = mejores[np.argsort(plano[mejores], kind="stable")]
+
+        elegidos = []
+        vistos = set()
+        for indice in mejores:
+            estado, i = divmod(int(indice), n)
+            if puntaje[estado, i] == infinito:
+                break
+            mascara = mascaras[estado] | (1 << i)
+            if mascara in vistos:
+                continue
+            vistos.add(mascara)
+            elegidos.append((estado, i, mascara))
+            if len(elegidos) == ancho:
+                break
+
+        estados = np.array([e for e, _, _ in elegidos])
+        tablones = np.array([i for _, i, _ in elegidos])
+        pendientes = pendientes[estados]
+        pendientes[np.arange(len(elegidos)), tablones] = False
+        tiempo = instante[estados, tablones]
+        costo = nuevo_costo[estados, tablones]
+        mascaras = [m for _, _, m in elegidos]
+        padres.append((estados, tablones))
+
+    # Reconstrucción desde el mejor estado completo (todos comparten máscara)
+    mejor_perm = []
+    estado = 0
+    for estados, tablones in reversed(padres):
+        mejor_perm.append(int(orden_clave[tablones[estado]]))
+        estado = estados[estado]
+    mejor_perm.reverse()
+
+    return mejor_perm, int(costo[0])
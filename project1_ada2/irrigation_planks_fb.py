@@ -3,6 +3,20 @@ Algoritmo de Fuerza Bruta para el problema de riego óptimo.
 Genera todas las permutaciones posibles y selecciona la de menor costo.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import json
+import math
+from multiprocessing import Value
+import os
+import time
+
+import numpy as np
+
+from project1_ada2.dominancia import precedencias as calcular_precedencias
+from project1_ada2.irrigation_planks_rov import roPV
+from project1_ada2.reduccion import resolver_reducido
+
 
 def permute_yield(nums):
     """
@@ -30,6 +44,39 @@ def permute_yield(nums):
     yield from backtrack()
 
 
+def permutaciones_heap(nums):
+    """
+    Enumerador iterativo de permutaciones (algoritmo de Heap).
+
+    Modifica `nums` in-place sin recursión ni copias: el contenido inicial de
+    `nums` es la primera permutación y cada paso produce únicamente las dos
+    posiciones que se intercambiaron para llegar a la siguiente, de modo que
+    quien llama puede actualizar el costo por diferencias.
+
+    Args:
+        nums (list): Lista de elementos a permutar (se modifica in-place)
+
+    Yields:
+        tuple: (j, i) con j < i, posiciones intercambiadas en `nums`
+
+    Complejidad: O(n!) pasos, O(1) amortizado por paso, O(n) espacio
+    """
+    n = len(nums)
+    c = [0] * n
+
+    i = 1
+    while i < n:
+        if c[i] < i:
+            j = 0 if i % 2 == 0 else c[i]
+            nums[j], nums[i] = nums[i], nums[j]
+            yield j, i
+            c[i] += 1
+            i = 1
+        else:
+            c[i] = 0
+            i += 1
+
+
 def calcular_costo(finca, perm):
     """
     Calcula el costo total CRF_Π para una permutación dada.
@@ -72,7 +119,797 @@ def calcular_costo(finca, perm):
     return costo_total
 
 
-def roFB(finca):
+def _guardar_checkpoint(ruta, estado):
+    """
+    Escribe el checkpoint de forma atómica (archivo temporal + reemplazo), para
+    que un proceso interrumpido a mitad de escritura no deje un JSON corrupto.
+    """
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "w") as f:
+        json.dump(estado, f)
+    os.replace(temporal, ruta)
+
+
+def _cargar_checkpoint(ruta, finca, modo):
+    """
+    Lee un checkpoint previo, o None si no existe.
+
+    Raises:
+        ValueError: Si el checkpoint pertenece a otra finca o a otro modo
+    """
+    if not os.path.exists(ruta):
+        return None
+
+    with open(ruta, "r") as f:
+        estado = json.load(f)
+
+    if estado.get("modo") != modo or estado.get("finca") != [list(t) for t in finca]:
+        raise ValueError(f"El checkpoint {ruta} no corresponde a esta finca o a este modo")
+
+    return estado
+
+
+def _busqueda_arbol(finca, podar, checkpoint, resume, intervalo_checkpoint, time_limit,
+                    predecesores=None):
+    """
+    Motor común de busqueda_incremental y busqueda_ramificacion_poda.
+
+    Recorre el árbol de backtracking de permute_yield arrastrando el costo del
+    prefijo. Con `podar` se siembra con roPV y se descartan los prefijos sin
+    futuro. Con `predecesores` (ver dominancia.precedencias) solo se coloca un
+    tablón cuando todos sus predecesores ya están en el prefijo. Gestiona
+    además el checkpoint periódico y el límite de tiempo.
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo, reporte)
+    """
+    modo = "bnb" if podar else "incremental"
+    if predecesores is not None:
+        modo += "+precedencias"
+    n = len(finca)
+    nums = list(range(n))
+    tiempo_total = sum(tr for _, tr, _ in finca)
+    factoriales = [math.factorial(k) for k in range(n + 1)]
+
+    mejor_perm = None
+    mejor_costo = float('inf')
+    es_semilla = False
+
+    if podar:
+        # La solución voraz es la incumbente inicial
+        mejor_perm, mejor_costo = roPV(finca)
+        es_semilla = True
+
+    cursor = []
+    if checkpoint and resume:
+        estado = _cargar_checkpoint(checkpoint, finca, modo)
+        if estado is not None:
+            cursor = estado["cursor"]
+            es_semilla = estado["es_semilla"]
+            if estado["mejor_perm"] is not None:
+                mejor_perm = estado["mejor_perm"]
+                mejor_costo = estado["mejor_costo"]
+
+    ruta = [0] * n
+    nodos = 0
+    ultimo_guardado = time.perf_counter()
+    limite = None if time_limit is None else time.perf_counter() + time_limit
+
+    agotado = False
+    hojas_cubiertas = 0       # hojas visitadas o descartadas por poda
+    cota_abierta = float('inf')  # menor cota de los subárboles sin explorar
+
+    def guardar(inicio):
+        _guardar_checkpoint(checkpoint, {
+            "modo": modo,
+            "finca": [list(t) for t in finca],
+            "cursor": ruta[:inicio],
+            "mejor_perm": mejor_perm,
+            "mejor_costo": mejor_costo if mejor_perm is not None else None,
+            "es_semilla": es_semilla,
+        })
+
+    def backtrack(inicio, tiempo, acumulado, reanudando, colocados):
+        nonlocal mejor_perm, mejor_costo, es_semilla, nodos, ultimo_guardado
+        nonlocal agotado, hojas_cubiertas, cota_abierta
+
+        nodos += 1
+        if nodos % 1024 == 0:
+            ahora = time.perf_counter()
+            if limite is not None and ahora >= limite:
+                agotado = True
+                if checkpoint:
+                    guardar(inicio)
+            elif checkpoint and ahora - ultimo_guardado >= intervalo_checkpoint:
+                guardar(inicio)
+                ultimo_guardado = ahora
+
+        if agotado:
+            # Este subárbol queda abierto: solo se aporta su cota
+            restantes = nums[inicio:]
+            cota = acumulado + cota_inferior(finca, restantes, tiempo, tiempo_total)
+            cota_abierta = min(cota_abierta, cota)
+            return
+
+        if inicio == n:
+            hojas_cubiertas += 1
+            if acumulado < mejor_costo or (es_semilla and acumulado == mejor_costo):
+                mejor_costo = acumulado
+                mejor_perm = nums[:]
+                es_semilla = False
+            return
+
+        en_cursor = reanudando and inicio < len(cursor)
+        desde = cursor[inicio] if en_cursor else inicio
+
+        for i in range(desde, n):
+            if predecesores is not None and predecesores[nums[i]] & ~colocados:
+                # Orden incompatible con el DAG: el subárbol queda descartado
+                hojas_cubiertas += factoriales[n - inicio - 1]
+                continue
+
+            ruta[inicio] = i
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+            ts, tr, p = finca[nums[inicio]]
+            nuevos = colocados | (1 << nums[inicio])
+            fin_riego = tiempo + tr
+            nuevo_acumulado = acumulado + p * max(0, fin_riego - ts)
+
+            if agotado:
+                # Hermano sin explorar: aporta su cota al reporte
+                cota = nuevo_acumulado + cota_inferior(finca, nums[inicio + 1:], fin_riego, tiempo_total)
+                cota_abierta = min(cota_abierta, cota)
+            elif not podar:
+                backtrack(inicio + 1, fin_riego, nuevo_acumulado, en_cursor and i == desde, nuevos)
+            else:
+                # Mientras la incumbente sea la semilla voraz, un empate todavía
+                # puede aportar la primera hoja óptima del recorrido
+                cota = nuevo_acumulado + cota_inferior(finca, nums[inicio + 1:], fin_riego, tiempo_total)
+                if cota < mejor_costo or (es_semilla and cota == mejor_costo):
+                    backtrack(inicio + 1, fin_riego, nuevo_acumulado, en_cursor and i == desde, nuevos)
+                else:
+                    hojas_cubiertas += factoriales[n - inicio - 1]
+
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+
+    # Los subárboles anteriores al cursor ya se cubrieron en la ejecución previa
+    for nivel, elegido in enumerate(cursor):
+        hojas_cubiertas += (elegido - nivel) * factoriales[n - nivel - 1]
+
+    backtrack(0, 0, 0, True, 0)
+
+    if checkpoint and not agotado and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    cota_global = min(mejor_costo, cota_abierta)
+    if mejor_costo == float('inf'):
+        brecha = float('inf')
+    elif mejor_costo == 0:
+        brecha = 0.0
+    else:
+        brecha = (mejor_costo - cota_global) / mejor_costo
+
+    reporte = {
+        "completo": not agotado,
+        "fraccion_explorada": hojas_cubiertas / factoriales[n],
+        "cota_inferior": cota_global,
+        "brecha": brecha,
+    }
+
+    return mejor_perm, mejor_costo, reporte
+
+
+def busqueda_incremental(finca, checkpoint=None, resume=False, intervalo_checkpoint=60.0,
+                         time_limit=None, predecesores=None):
+    """
+    Fuerza bruta con evaluación incremental del costo del prefijo.
+
+    Recorre exactamente el mismo árbol de backtracking que permute_yield
+    (mismo orden de hojas), pero en lugar de recalcular el costo de cada
+    permutación completa arrastra hacia abajo el tiempo transcurrido y la
+    penalización acumulada del prefijo. Colocar un tablón en la posición
+    `inicio` cuesta O(1), de modo que cada hoja sale gratis.
+
+    Si se indica `checkpoint`, cada `intervalo_checkpoint` segundos se guarda
+    en ese archivo JSON el cursor del recorrido (el índice elegido en cada
+    nivel del camino actual) junto con la incumbente. Con `resume=True` se
+    reproduce ese camino y se continúa desde ahí; el resultado final es el
+    mismo que el de una ejecución sin interrupciones. El archivo se borra al
+    terminar.
+
+    Con `time_limit` (segundos) la búsqueda se detiene al agotarse el tiempo
+    y devuelve la mejor permutación encontrada hasta entonces; el reporte
+    indica qué fracción del espacio se cubrió y una cota inferior del óptimo.
+    Si además hay checkpoint, queda guardado para reanudar después.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+        checkpoint (str o Path): Archivo de checkpoint (opcional)
+        resume (bool): Continuar desde el checkpoint si existe
+        intervalo_checkpoint (float): Segundos entre escrituras del checkpoint
+        time_limit (float): Tiempo máximo de búsqueda en segundos (opcional)
+        predecesores (list): Máscaras de precedencia por tablón (opcional)
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo, reporte), con reporte un dict
+               {"completo", "fraccion_explorada", "cota_inferior", "brecha"}
+
+    Raises:
+        ValueError: Si el checkpoint pertenece a otra finca o a otro modo
+
+    Complejidad temporal: O(n!) - un trabajo O(1) por nodo del árbol
+    Complejidad espacial: O(n) - profundidad de la recursión
+    """
+    return _busqueda_arbol(finca, False, checkpoint, resume, intervalo_checkpoint, time_limit,
+                           predecesores)
+
+
+def calcular_costo_lote(finca, perms, tiempo_inicial=0):
+    """
+    Calcula el costo CRF_Π de muchas permutaciones a la vez con NumPy.
+
+    Los tiempos de fin de riego de todas las filas salen de una suma acumulada
+    sobre la columna tr reunida según cada permutación, y las penalizaciones
+    se calculan en una sola pasada vectorizada.
+
+    Args:
+        finca (list o ndarray): Tablones [[ts, tr, p], ...]
+        perms (ndarray): Arreglo 2-D de índices, forma (lote, k)
+        tiempo_inicial (int): Instante en que empieza el primer tablón de cada fila
+                              (permite evaluar solo el sufijo de una permutación)
+
+    Returns:
+        ndarray: Costo de cada fila, forma (lote,)
+
+    Complejidad: O(lote × k)
+    """
+    datos = np.asarray(finca, dtype=np.int64).reshape(-1, 3)
+    ts, tr, p = datos[:, 0], datos[:, 1], datos[:, 2]
+
+    fin_riego = tiempo_inicial + np.cumsum(tr[perms], axis=1)
+    retrasos = np.maximum(0, fin_riego - ts[perms])
+
+    return (p[perms] * retrasos).sum(axis=1)
+
+
+def busqueda_vectorizada(finca, tam_bloque=5040):
+    """
+    Fuerza bruta que evalúa las permutaciones por bloques con NumPy.
+
+    Recorre en Python solo los prefijos del árbol de backtracking; las m!
+    ordenaciones de los últimos m tablones (m! <= tam_bloque) se escriben de una
+    vez en un buffer preasignado usando una tabla de permutaciones precalculada
+    con permute_yield, y se evalúan con calcular_costo_lote. Como la tabla
+    respeta el orden de permute_yield y np.argmin devuelve el primer mínimo,
+    el resultado coincide con el de la fuerza bruta serial.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+        tam_bloque (int): Máximo de permutaciones evaluadas por bloque
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo)
+
+    Complejidad temporal: O(n! × m) operaciones vectorizadas
+    Complejidad espacial: O(tam_bloque × m)
+    """
+    n = len(finca)
+    nums = list(range(n))
+
+    # Mayor m tal que m! cabe en un bloque
+    m = 0
+    while m < n and math.factorial(m + 1) <= tam_bloque:
+        m += 1
+
+    datos = np.asarray(finca, dtype=np.int64).reshape(-1, 3)
+    tabla = np.array(list(permute_yield(list(range(m)))), dtype=np.intp).reshape(math.factorial(m), m)
+    bloque = np.empty((len(tabla), m), dtype=np.intp)
+
+    mejor_perm = None
+    mejor_costo = float('inf')
+    profundidad = n - m
+
+    def backtrack(inicio, tiempo, acumulado):
+        nonlocal mejor_perm, mejor_costo
+
+        if inicio == profundidad:
+            sufijo = np.array(nums[profundidad:], dtype=np.intp)
+            np.take(sufijo, tabla, out=bloque)
+            costos = calcular_costo_lote(datos, bloque, tiempo)
+            fila = int(np.argmin(costos))
+            costo = acumulado + int(costos[fila])
+            if costo < mejor_costo:
+                mejor_costo = costo
+                mejor_perm = nums[:profundidad] + bloque[fila].tolist()
+            return
+
+        for i in range(inicio, n):
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+            ts, tr, p = finca[nums[inicio]]
+            fin_riego = tiempo + tr
+            backtrack(inicio + 1, fin_riego, acumulado + p * max(0, fin_riego - ts))
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+
+    backtrack(0, 0, 0)
+
+    return mejor_perm, mejor_costo
+
+
+def busqueda_heap(finca):
+    """
+    Fuerza bruta sobre el enumerador iterativo permutaciones_heap.
+
+    Mantiene el fin de riego y la penalización de cada posición; tras cada
+    intercambio (j, i) solo recalcula las posiciones j..i, que son las únicas
+    cuyo tiempo cambia. En el algoritmo de Heap los intercambios lejanos son
+    raros, así que el trabajo por permutación es O(1) amortizado, y solo se
+    copia la permutación cuando mejora la incumbente.
+
+    A diferencia de los demás modos, el orden de visita es el de Heap: ante
+    empates puede devolver otra permutación óptima distinta.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo)
+
+    Complejidad temporal: O(n!) amortizado
+    Complejidad espacial: O(n)
+    """
+    n = len(finca)
+    nums = list(range(n))
+    fines = [0] * n
+    penalizaciones = [0] * n
+
+    tiempo = 0
+    costo = 0
+    for k, idx in enumerate(nums):
+        ts, tr, p = finca[idx]
+        tiempo += tr
+        fines[k] = tiempo
+        penalizaciones[k] = p * max(0, tiempo - ts)
+        costo += penalizaciones[k]
+
+    mejor_perm = nums[:]
+    mejor_costo = costo
+
+    for j, i in permutaciones_heap(nums):
+        tiempo = fines[j - 1] if j > 0 else 0
+        for k in range(j, i + 1):
+            ts, tr, p = finca[nums[k]]
+            tiempo += tr
+            fines[k] = tiempo
+            penalizacion = p * max(0, tiempo - ts)
+            costo += penalizacion - penalizaciones[k]
+            penalizaciones[k] = penalizacion
+
+        if costo < mejor_costo:
+            mejor_costo = costo
+            mejor_perm = nums[:]
+
+    return mejor_perm, mejor_costo
+
+
+def agrupar_tablones(finca):
+    """
+    Agrupa los tablones idénticos (mismo ts, tr y p).
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+
+    Returns:
+        tuple: (tipos, indices)
+               - tipos: lista de tablones distintos en orden de primera aparición
+               - indices: indices[t] es la lista creciente de tablones del tipo t
+    """
+    posicion = {}
+    tipos = []
+    indices = []
+
+    for i, tablon in enumerate(finca):
+        clave = tuple(tablon)
+        if clave not in posicion:
+            posicion[clave] = len(tipos)
+            tipos.append(clave)
+            indices.append([])
+        indices[posicion[clave]].append(i)
+
+    return tipos, indices
+
+
+def busqueda_multiconjunto(finca):
+    """
+    Fuerza bruta sobre permutaciones distintas de un multiconjunto.
+
+    Intercambiar dos tablones idénticos nunca cambia el costo, así que se
+    agrupan con agrupar_tablones y se enumeran solo las secuencias distintas de
+    tipos, con el costo del prefijo arrastrado como en busqueda_incremental.
+    Al final, cada tipo se traduce a sus índices concretos en orden creciente.
+    Con k copias de un mismo tablón el árbol se reduce en un factor k!.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo)
+
+    Complejidad temporal: O(n! / (k_1! · k_2! · ... · k_t!)) nodos hoja
+    Complejidad espacial: O(n)
+    """
+    n = len(finca)
+    tipos, indices = agrupar_tablones(finca)
+    restantes = [len(grupo) for grupo in indices]
+    secuencia = [0] * n
+
+    mejor_secuencia = None
+    mejor_costo = float('inf')
+
+    def backtrack(inicio, tiempo, acumulado):
+        nonlocal mejor_secuencia, mejor_costo
+
+        if inicio == n:
+            if acumulado < mejor_costo:
+                mejor_costo = acumulado
+                mejor_secuencia = secuencia[:]
+            return
+
+        for t, (ts, tr, p) in enumerate(tipos):
+            if restantes[t] == 0:
+                continue
+            restantes[t] -= 1
+            secuencia[inicio] = t
+            fin_riego = tiempo + tr
+            backtrack(inicio + 1, fin_riego, acumulado + p * max(0, fin_riego - ts))
+            restantes[t] += 1
+
+    backtrack(0, 0, 0)
+
+    # Traducir cada tipo a sus tablones concretos
+    siguiente = [0] * len(tipos)
+    mejor_perm = []
+    for t in mejor_secuencia:
+        mejor_perm.append(indices[t][siguiente[t]])
+        siguiente[t] += 1
+
+    return mejor_perm, mejor_costo
+
+
+def cota_inferior(finca, restantes, tiempo, tiempo_total):
+    """
+    Cota inferior admisible del costo de regar los tablones `restantes`
+    empezando en `tiempo`.
+
+    Cada tablón j termina, como muy pronto, en tiempo + tr_j, así que paga al
+    menos p_j · max(0, tiempo + tr_j - ts_j). Además, alguno de ellos tiene que
+    ser el último y terminar en `tiempo_total`; se suma el menor recargo que
+    eso produce sobre su cota individual.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+        restantes (iterable): Índices de los tablones aún sin regar
+        tiempo (int): Instante en que empieza a regarse el primero de ellos
+        tiempo_total (int): Suma de tr de toda la finca
+
+    Returns:
+        int: Cota inferior del costo restante (nunca lo sobreestima)
+
+    Complejidad: O(len(restantes))
+    """
+    cota = 0
+    menor_recargo = None
+
+    for j in restantes:
+        ts, tr, p = finca[j]
+        minimo = p * max(0, tiempo + tr - ts)
+        cota += minimo
+        recargo = p * max(0, tiempo_total - ts) - minimo
+        if menor_recargo is None or recargo < menor_recargo:
+            menor_recargo = recargo
+
+    if menor_recargo is not None:
+        cota += menor_recargo
+
+    return cota
+
+
+def busqueda_ramificacion_poda(finca, checkpoint=None, resume=False, intervalo_checkpoint=60.0,
+                               time_limit=None, predecesores=None):
+    """
+    Fuerza bruta con ramificación y poda (branch and bound).
+
+    Usa la solución voraz (roPV) como cota superior inicial y recorre el árbol
+    de busqueda_incremental descartando todo prefijo cuya penalización
+    acumulada más cota_inferior sobre los tablones restantes ya alcanza o
+    supera al mejor costo conocido. Los empates con la semilla voraz no se
+    podan hasta que el recorrido encuentre su primera hoja, así que el
+    resultado es exactamente la misma permutación que devuelve la fuerza
+    bruta completa.
+
+    Admite checkpoint, reanudación y límite de tiempo igual que
+    busqueda_incremental; los subárboles podados cuentan como cubiertos.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+        checkpoint (str o Path): Archivo de checkpoint (opcional)
+        resume (bool): Continuar desde el checkpoint si existe
+        intervalo_checkpoint (float): Segundos entre escrituras del checkpoint
+        time_limit (float): Tiempo máximo de búsqueda en segundos (opcional)
+        predecesores (list): Máscaras de precedencia por tablón (opcional)
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo, reporte)
+
+    Raises:
+        ValueError: Si el checkpoint pertenece a otra finca o a otro modo
+
+    Complejidad temporal: O(n! × n) en el peor caso, normalmente muy inferior
+    Complejidad espacial: O(n)
+    """
+    return _busqueda_arbol(finca, True, checkpoint, resume, intervalo_checkpoint, time_limit,
+                           predecesores)
+
+
+# Mejor costo conocido por todos los procesos del modo paralelo
+_mejor_compartido = None
+
+
+def _inicializar_trabajador(mejor_compartido):
+    """Guarda en cada proceso hijo la referencia al mejor costo compartido."""
+    global _mejor_compartido
+    _mejor_compartido = mejor_compartido
+
+
+def _prefijos(finca, nums, profundidad, tiempo_total, cota_superior):
+    """
+    Genera los subárboles de profundidad `profundidad` en el mismo orden en que
+    los visita el backtracking serial.
+
+    Cada subárbol se describe como (nums, tiempo, acumulado): el arreglo tras
+    aplicar los intercambios de su prefijo, el tiempo transcurrido y la
+    penalización acumulada. Los prefijos cuya cota ya supera a
+    `cota_superior` no se generan.
+    """
+    n = len(finca)
+    tareas = []
+
+    def expandir(inicio, tiempo, acumulado):
+        if inicio == profundidad:
+            tareas.append((nums[:], tiempo, acumulado))
+            return
+
+        for i in range(inicio, n):
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+            ts, tr, p = finca[nums[inicio]]
+            fin_riego = tiempo + tr
+            nuevo_acumulado = acumulado + p * max(0, fin_riego - ts)
+
+            cota = nuevo_acumulado + cota_inferior(finca, nums[inicio + 1:], fin_riego, tiempo_total)
+            if cota <= cota_superior:
+                expandir(inicio + 1, fin_riego, nuevo_acumulado)
+
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+
+    expandir(0, 0, 0)
+
+    return tareas
+
+
+def _explorar_subarbol(finca, nums, inicio, tiempo, acumulado):
+    """
+    Ramificación y poda sobre el subárbol que fija nums[:inicio].
+
+    Poda contra el mejor costo local del subárbol (ya se encontró una hoja
+    anterior, así que los empates sobran) y contra el mejor costo compartido
+    entre procesos (solo lo estrictamente peor, porque ese costo puede venir
+    de un subárbol posterior que pierde los empates).
+
+    La poda lee el costo compartido sin tomar el candado del Value (con
+    get_obj): leer un valor atrasado solo poda menos, nunca de más. El
+    candado se toma únicamente para actualizarlo al encontrar una hoja mejor.
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo) del subárbol, o (None, inf)
+    """
+    n = len(finca)
+    tiempo_total = sum(tr for _, tr, _ in finca)
+    compartido = _mejor_compartido.get_obj()
+
+    mejor_perm = None
+    mejor_costo = float('inf')
+
+    def backtrack(inicio, tiempo, acumulado):
+        nonlocal mejor_perm, mejor_costo
+
+        if inicio == n:
+            if acumulado < mejor_costo:
+                mejor_costo = acumulado
+                mejor_perm = nums[:]
+                with _mejor_compartido.get_lock():
+                    if acumulado < _mejor_compartido.value:
+                        _mejor_compartido.value = acumulado
+            return
+
+        for i in range(inicio, n):
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+            ts, tr, p = finca[nums[inicio]]
+            fin_riego = tiempo + tr
+            nuevo_acumulado = acumulado + p * max(0, fin_riego - ts)
+
+            cota = nuevo_acumulado + cota_inferior(finca, nums[inicio + 1:], fin_riego, tiempo_total)
+            if cota < mejor_costo and cota <= compartido.value:
+                backtrack(inicio + 1, fin_riego, nuevo_acumulado)
+
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+
+    backtrack(inicio, tiempo, acumulado)
+
+    return mejor_perm, mejor_costo
+
+
+def busqueda_paralela(finca, procesos=None, profundidad=2):
+    """
+    Ramificación y poda repartida entre varios procesos.
+
+    Divide el árbol de permutaciones por sus primeras `profundidad` posiciones
+    y envía cada subárbol a un ProcessPoolExecutor. Los procesos comparten el
+    mejor costo encontrado (sembrado con roPV) para podar unos contra otros.
+    Al combinar, los empates se rompen a favor del subárbol que el recorrido
+    serial visita primero, así que la respuesta es idéntica a la de
+    roFB(finca, mode="incremental").
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+        procesos (int): Número de procesos (por defecto os.cpu_count())
+        profundidad (int): Posiciones fijadas en cada subárbol
+
+    Returns:
+        tuple: (mejor_permutacion, mejor_costo)
+    """
+    n = len(finca)
+    if n == 0:
+        return [], 0
+
+    profundidad = max(0, min(profundidad, n))
+    tiempo_total = sum(tr for _, tr, _ in finca)
+
+    _, costo_voraz = roPV(finca)
+
+    tareas = _prefijos(finca, list(range(n)), profundidad, tiempo_total, costo_voraz)
+
+    mejor_compartido = Value('q', costo_voraz)
+    with ProcessPoolExecutor(max_workers=procesos or os.cpu_count(),
+                             initializer=_inicializar_trabajador,
+                             initargs=(mejor_compartido,)) as ejecutor:
+        futuros = [ejecutor.submit(_explorar_subarbol, finca, nums, profundidad, tiempo, acumulado)
+                   for nums, tiempo, acumulado in tareas]
+        resultados = [futuro.result() for futuro in futuros]
+
+    # Combinar en el orden serial: solo una mejora estricta reemplaza
+    mejor_perm = None
+    mejor_costo = float('inf')
+    for perm, costo in resultados:
+        if costo < mejor_costo:
+            mejor_costo = costo
+            mejor_perm = perm
+
+    return mejor_perm, mejor_costo
+
+
+def mejores_k(finca, k):
+    """
+    Devuelve los k órdenes de riego más baratos.
+
+    Recorre el árbol de busqueda_incremental guardando las k mejores hojas en
+    un montículo acotado (máximo por costo). En cuanto el montículo está
+    lleno, todo prefijo cuya cota_inferior ya alcanza al peor de los k se
+    poda, así que pedir alternativas cuesta en función de k y no de una
+    segunda enumeración completa. Ante empates se conservan las hojas que el
+    recorrido serial visita primero.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+        k (int): Número de alternativas a devolver
+
+    Returns:
+        list: [(permutacion, costo), ...] ordenada de menor a mayor costo
+
+    Complejidad temporal: O(n! × n) en el peor caso
+    Complejidad espacial: O(k × n)
+    """
+    n = len(finca)
+    nums = list(range(n))
+    tiempo_total = sum(tr for _, tr, _ in finca)
+
+    # Montículo de (-costo, -orden_de_visita, permutación): la raíz es el peor
+    monticulo = []
+    visitadas = 0
+
+    def backtrack(inicio, tiempo, acumulado):
+        nonlocal visitadas
+
+        if inicio == n:
+            entrada = (-acumulado, -visitadas, nums[:])
+            visitadas += 1
+            if len(monticulo) < k:
+                heapq.heappush(monticulo, entrada)
+            elif acumulado < -monticulo[0][0]:
+                heapq.heapreplace(monticulo, entrada)
+            return
+
+        for i in range(inicio, n):
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+            ts, tr, p = finca[nums[inicio]]
+            fin_riego = tiempo + tr
+            nuevo_acumulado = acumulado + p * max(0, fin_riego - ts)
+
+            cota = nuevo_acumulado + cota_inferior(finca, nums[inicio + 1:], fin_riego, tiempo_total)
+            if len(monticulo) < k or cota < -monticulo[0][0]:
+                backtrack(inicio + 1, fin_riego, nuevo_acumulado)
+
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+
+    if k > 0:
+        backtrack(0, 0, 0)
+
+    return [(perm, -costo) for costo, _, perm in sorted(monticulo, reverse=True)]
+
+
+def todos_optimos(finca):
+    """
+    Devuelve todos los órdenes de riego empatados en el costo óptimo.
+
+    Ramificación y poda donde solo se descarta lo estrictamente peor que el
+    mejor costo conocido, para no perder ningún empate.
+
+    Args:
+        finca (list): Lista de tablones [[ts, tr, p], ...]
+
+    Returns:
+        tuple: (permutaciones_optimas, costo_optimo), con las permutaciones en
+               el orden en que las visita el recorrido serial
+
+    Complejidad temporal: O(n! × n) en el peor caso
+    Complejidad espacial: O(n × cantidad de óptimos)
+    """
+    n = len(finca)
+    nums = list(range(n))
+    tiempo_total = sum(tr for _, tr, _ in finca)
+
+    optimos = []
+    mejor_costo = float('inf')
+
+    def backtrack(inicio, tiempo, acumulado):
+        nonlocal optimos, mejor_costo
+
+        if inicio == n:
+            if acumulado < mejor_costo:
+                mejor_costo = acumulado
+                optimos = [nums[:]]
+            elif acumulado == mejor_costo:
+                optimos.append(nums[:])
+            return
+
+        for i in range(inicio, n):
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+            ts, tr, p = finca[nums[inicio]]
+            fin_riego = tiempo + tr
+            nuevo_acumulado = acumulado + p * max(0, fin_riego - ts)
+
+            cota = nuevo_acumulado + cota_inferior(finca, nums[inicio + 1:], fin_riego, tiempo_total)
+            if cota <= mejor_costo:
+                backtrack(inicio + 1, fin_riego, nuevo_acumulado)
+
+            nums[inicio], nums[i] = nums[i], nums[inicio]
+
+    backtrack(0, 0, 0)
+
+    return optimos, mejor_costo
+
+
+def roFB(finca, mode="incremental", procesos=None, profundidad=2, tam_bloque=5040,
+         checkpoint=None, resume=False, intervalo_checkpoint=60.0, time_limit=None,
+         reporte=False, precedencias=False, reducir=False):
     """
     Algoritmo de Fuerza Bruta para el problema de riego óptimo.
     Genera todas las permutaciones posibles de los tablones y elige la de menor costo.
@@ -82,13 +919,46 @@ def roFB(finca):
                      donde ts = tiempo supervivencia
                            tr = tiempo regado
                            p = prioridad (1-4)
+        mode (str): Motor de búsqueda a usar
+                    - "incremental": backtracking que arrastra el costo del prefijo (O(n!))
+                    - "clasico": evalúa cada permutación desde cero con calcular_costo (O(n! × n))
+                    - "bnb": ramificación y poda sembrada con la solución voraz
+                    - "paralelo": ramificación y poda repartida por prefijos entre procesos
+                    - "numpy": evaluación por bloques de permutaciones con NumPy
+                    - "heap": enumeración iterativa de Heap con costo por diferencias
+                              (ante empates puede elegir otra permutación óptima)
+                    - "multiconjunto": agrupa tablones idénticos y enumera solo
+                                       órdenes distintos de tipos
+        procesos (int): Procesos del modo paralelo (por defecto os.cpu_count())
+        profundidad (int): Posiciones fijadas por subárbol en el modo paralelo
+        tam_bloque (int): Permutaciones evaluadas por bloque en el modo numpy
+        checkpoint (str o Path): Archivo donde guardar el progreso periódicamente
+                                 (modos "incremental" y "bnb")
+        resume (bool): Continuar desde `checkpoint` si existe
+        intervalo_checkpoint (float): Segundos entre escrituras del checkpoint
+        time_limit (float): Segundos máximos de búsqueda (modos "incremental" y
+                            "bnb"); al agotarse se devuelve la mejor solución hallada
+        reporte (bool): Si es True, devuelve además el reporte de la búsqueda
+                        (modos "incremental" y "bnb")
+        precedencias (bool): Recorrer solo los órdenes compatibles con el DAG
+                             de dominancia.precedencias (modos "incremental"
+                             y "bnb"); el costo sigue siendo el óptimo
+        reducir (bool): Fijar antes los tablones de posición conocida
+                        (reduccion.reducir) y buscar solo sobre el núcleo
 
     Returns:
         tuple: (mejor_permutacion, mejor_costo)
                - mejor_permutacion: lista de índices en orden óptimo
                - mejor_costo: costo mínimo encontrado
+               Con reporte=True: (mejor_permutacion, mejor_costo, reporte), donde
+               reporte = {"completo", "fraccion_explorada", "cota_inferior", "brecha"}
 
-    Complejidad temporal: O(n! × n) - genera n! permutaciones y calcula costo O(n) cada una
+    Raises:
+        ValueError: Si el modo no existe, si el modo no admite checkpoint,
+                    límite de tiempo, reporte o precedencias, o si el
+                    checkpoint pertenece a otra finca
+
+    Complejidad temporal: O(n! × n) en modo clásico, O(n!) en modo incremental
     Complejidad espacial: O(n) - almacena permutación actual y mejor
 
     Ejemplo:
@@ -96,6 +966,38 @@ def roFB(finca):
         >>> perm, costo = roFB(finca)
         >>> print(f"Orden: {perm}, Costo: {costo}")
     """
+    if reducir:
+        return resolver_reducido(finca, lambda nucleo: roFB(
+            nucleo, mode, procesos, profundidad, tam_bloque, checkpoint, resume,
+            intervalo_checkpoint, time_limit, reporte, precedencias))
+
+    if mode in ("incremental", "bnb"):
+        motor = busqueda_incremental if mode == "incremental" else busqueda_ramificacion_poda
+        predecesores = calcular_precedencias(finca) if precedencias else None
+        mejor_perm, mejor_costo, info = motor(finca, checkpoint, resume, intervalo_checkpoint, time_limit,
+                                              predecesores)
+        if reporte:
+            return mejor_perm, mejor_costo, info
+        return mejor_perm, mejor_costo
+
+    if checkpoint is not None or time_limit is not None or reporte or precedencias:
+        raise ValueError(f"El modo {mode} no admite checkpoint, límite de tiempo, reporte ni precedencias")
+
+    if mode == "paralelo":
+        return busqueda_paralela(finca, procesos, profundidad)
+
+    if mode == "numpy":
+        return busqueda_vectorizada(finca, tam_bloque)
+
+    if mode == "heap":
+        return busqueda_heap(finca)
+
+    if mode == "multiconjunto":
+        return busqueda_multiconjunto(finca)
+
+    if mode != "clasico":
+        raise ValueError(f"Modo de fuerza bruta desconocido: {mode}")
+
     n = len(finca)
     indices = list(range(n))
 
@@ -0,0 +1,100 @@
+import math
+import random
+import time
+
+from project1_ada2.irrigation_planks_rov import (REGLAS_ESTATICAS, portafolio, descender,
+                                                 intercambiar_bloques)
+
+
+def _costo_tramo(finca, orden, fin, a, c):
+    """Penalización de los tablones en las posiciones [a, c) del orden."""
+    costo = 0
+    for k in range(a, c):
+        ts, _, p = finca[orden[k]]
+        costo += p * max(0, fin[k] - ts)
+    return costo
+
+
+def roILS(finca, tiempo_limite=1.0, semilla=None, trayectoria=False, max_iteraciones=None,
+          ventana=8, max_bloque=3, fuerza=3, temperatura=None):
+    """
+    Búsqueda local iterada con aceptación de recocido simulado.
+
+    Parte del mejor orden de las reglas de ordenamiento de rov.portafolio
+    (REGLAS_ESTATICAS, O(n log n)) y lo lleva a un óptimo local con
+    descender. Luego repite hasta agotar `tiempo_limite` segundos, contados
+    desde la llamada e incluyendo el orden inicial (o `max_iteraciones`):
+
+        1. Perturbación: `fuerza` intercambios de bloques al azar dentro de
+           una zona de 2·ventana posiciones; el costo cambia en O(ventana).
+        2. Búsqueda local solo alrededor de la zona perturbada.
+        3. Aceptación: siempre si no empeora; si empeora en Δ, con
+           probabilidad exp(-Δ / T), con T bajando linealmente hasta 0 a lo
+           largo del presupuesto. Si se rechaza, se vuelve al orden anterior.
+
+    `temperatura` es T inicial (por defecto 0.1 % del costo del óptimo local
+    del que parte, es decir, ya después del primer descenso). Con la misma
+    `semilla` y `max_iteraciones` el resultado es reproducible.
+
+    Retorna: (mejor_perm, mejor_costo), o (mejor_perm, mejor_costo, trayectoria)
+             con trayectoria = [(segundos, mejor_costo), ...] cada vez que mejora
+    """
+    inicio = time.perf_counter()
+    limite = inicio + tiempo_limite
+    azar = random.Random(semilla)
+    n = len(finca)
+
+    orden, costo, _ = portafolio(finca, reglas=REGLAS_ESTATICAS)
+    fin = []
+    tiempo = 0
+    for idx in orden:
+        tiempo += finca[idx][1]
+        fin.append(tiempo)
+    costo += descender(finca, orden, fin, [True] * n, ventana, max_bloque, limite=limite)
+
+    mejor_perm, mejor_costo = orden[:], costo
+    historia = [(time.perf_counter() - inicio, mejor_costo)]
+    if temperatura is None:
+        temperatura = 0.001 * costo
+
+    iteraciones = 0
+    while n > 1 and mejor_costo > 0 and time.perf_counter() < limite:
+        if max_iteraciones is not None and iteraciones >= max_iteraciones:
+            break
+        iteraciones += 1
+
+        anterior_orden, anterior_fin, anterior_costo = orden[:], fin[:], costo
+
+        # 1. Perturbación local
+        largo = min(n, 2 * ventana)
+        zona = azar.randrange(n - largo + 1)
+        antes = _costo_tramo(finca, orden, fin, zona, zona + largo)
+        for _ in range(fuerza):
+            a, b, c = sorted(azar.sample(range(zona, zona + largo + 1), 3))
+            if a < b < c:
+                intercambiar_bloques(finca, orden, fin, a, b, c)
+        costo += _costo_tramo(finca, orden, fin, zona, zona + largo) - antes
+
+        # 2. Búsqueda local alrededor de la zona
+        activa = [False] * n
+        for k in range(max(0, zona - ventana - max_bloque), min(n, zona + largo + ventana)):
+            activa[k] = True
+        costo += descender(finca, orden, fin, activa, ventana, max_bloque, limite=limite)
+
+        # 3. Aceptación
+        if costo < mejor_costo:
+            mejor_perm, mejor_costo = orden[:], costo
+            historia.append((time.perf_counter() - inicio, mejor_costo))
+
+        delta = costo - anterior_costo
+        if delta > 0:
+            progreso = min(1.0, (time.perf_counter() - inicio) / tiempo_limite) if tiempo_limite else 1.0
+            if max_iteraciones is not None:
+                progreso = iteraciones / max_iteraciones
+            t_actual = temperatura * (1 - progreso)
+            if t_actual <= 0 or azar.random() >= math.exp(-delta / t_actual):
+                orden, fin, costo = anterior_orden, anterior_fin, anterior_costo
+
+    if trayectoria:
+        return mejor_perm, mejor_costo, historia
+    return mejor_perm, mejor_costo
@@ -1,3 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
+import time
+
+import numpy as np
+
+from project1_ada2.reduccion import resolver_reducido
+
+
 def costo_total(finca, orden): #Funcion auxiliar para calcular el costo total dada una permutación
     tiempo = 0
     costo = 0
@@ -11,30 +19,317 @@ def costo_total(finca, orden): #Funcion auxiliar para calcular el costo total da
 
 
 
-def roPV(f):
+def _primera_mejora(finca, orden, fin, q, ventana, max_bloque):
+    """
+    Primer movimiento que baja el costo entre los que parten de la posición q,
+    como intercambio de los bloques contiguos orden[a:b] y orden[b:c]:
+
+        - hacia adelante: el bloque orden[q:q+largo] (largo = 1 es un
+          intercambio adyacente o una inserción, largo >= 2 un traslado de
+          bloque) pasa detrás de hasta `ventana` tablones
+        - hacia atrás: el tablón de q pasa delante de hasta `ventana` tablones
+
+    Los tiempos de fin cacheados en `fin` dan el cambio de cada tablón
+    desplazado, y al alargar el bloque que se salta solo se suma el término
+    del tablón nuevo: O(1) por paso en las inserciones y O(largo) en los
+    bloques. Fuera de [a, c) nada cambia.
+
+    Retorna: (a, b, c, delta) o None si no hay mejora
+    """
+    n = len(orden)
+    inicio = fin[q - 1] if q else 0
+
+    for largo in range(1, max_bloque + 1):
+        b = q + largo
+        if b >= n:
+            break
+        tr_a = fin[b - 1] - inicio
+        delta_b = 0
+        for c in range(b + 1, min(b + ventana, n) + 1):
+            ts, _, p = finca[orden[c - 1]]
+            delta_b += p * (max(0, fin[c - 1] - tr_a - ts) - max(0, fin[c - 1] - ts))
+            tr_b = fin[c - 1] - fin[b - 1]
+            delta_a = 0
+            for k in range(q, b):
+                ts, _, p = finca[orden[k]]
+                delta_a += p * (max(0, fin[k] + tr_b - ts) - max(0, fin[k] - ts))
+            if delta_a + delta_b < 0:
+                return q, b, c, delta_a + delta_b
+
+    ts_x, tr_x, p_x = finca[orden[q]]
+    penalizacion_x = p_x * max(0, fin[q] - ts_x)
+    delta_a = 0
+    for a in range(q - 1, max(q - ventana, 0) - 1, -1):
+        ts, _, p = finca[orden[a]]
+        delta_a += p * (max(0, fin[a] + tr_x - ts) - max(0, fin[a] - ts))
+        tr_a = fin[q - 1] - (fin[a - 1] if a else 0)
+        delta = delta_a + p_x * max(0, fin[q] - tr_a - ts_x) - penalizacion_x
+        if delta < 0:
+            return a, q, q + 1, delta
+
+    return None
+
+
+def intercambiar_bloques(finca, orden, fin, a, b, c):
+    """Intercambia los bloques contiguos orden[a:b] y orden[b:c] y
+    recalcula los tiempos de fin solo en el tramo [a, c)."""
+    orden[a:c] = orden[b:c] + orden[a:b]
+    tiempo = fin[a - 1] if a else 0
+    for k in range(a, c):
+        tiempo += finca[orden[k]][1]
+        fin[k] = tiempo
+
+
+def descender(finca, orden, fin, activa, ventana=8, max_bloque=3, max_pasadas=None, limite=None):
+    """
+    Búsqueda local in situ sobre `orden` y sus tiempos de fin `fin`,
+    revisando solo las posiciones marcadas en `activa`.
+
+    Cada pasada recorre las posiciones activas, alternando de izquierda a
+    derecha y de derecha a izquierda para que un tablón que avanza (o
+    retrocede) pueda seguir moviéndose en la misma pasada, y aplica la
+    primera mejora de _primera_mejora. Tras un movimiento solo se reactivan
+    las posiciones cuyos movimientos tocan el tramo modificado, así que una
+    pasada es lineal en n. Para al no quedar posiciones activas (óptimo
+    local), tras `max_pasadas` pasadas o al llegar al instante `limite` de
+    time.perf_counter().
+
+    Retorna: el cambio total de costo (<= 0)
+    """
+    n = len(orden)
+    cambio = 0
+    pasadas = 0
+    hay_activas = any(activa)
+    while hay_activas and (max_pasadas is None or pasadas < max_pasadas):
+        posiciones = range(n) if pasadas % 2 == 0 else range(n - 1, -1, -1)
+        pasadas += 1
+        hay_activas = False
+
+        for revisadas, q in enumerate(posiciones):
+            if limite is not None and revisadas % 256 == 0 and time.perf_counter() >= limite:
+                return cambio
+            if not activa[q]:
+                continue
+            activa[q] = False
+
+            movimiento = _primera_mejora(finca, orden, fin, q, ventana, max_bloque)
+            while movimiento is not None:
+                a, b, c, delta = movimiento
+                intercambiar_bloques(finca, orden, fin, a, b, c)
+                cambio += delta
+
+                for k in range(max(0, a - ventana - max_bloque), min(n, c + ventana)):
+                    activa[k] = True
+                hay_activas = True
+                movimiento = _primera_mejora(finca, orden, fin, q, ventana, max_bloque)
+            activa[q] = False
+
+    return cambio
+
+
+def busqueda_local(finca, orden, ventana=8, max_bloque=3, max_pasadas=None):
+    """Mejora un orden con búsqueda local hasta un óptimo local.
+
+    Vecindarios: intercambio adyacente, inserción y traslado de bloques de
+    hasta `max_bloque` tablones, todos a lo sumo `ventana` posiciones (ver
+    _primera_mejora y descender). Los tiempos de fin se recalculan solo en
+    el tramo movido. Sin `max_pasadas` termina en un óptimo local.
+
+    Retorna:
+        (orden, costo_total)"""
+    orden = list(orden)
+
+    fin = []
+    tiempo = 0
+    for idx in orden:
+        tiempo += finca[idx][1]
+        fin.append(tiempo)
+    costo = costo_total(finca, orden)
+
+    costo += descender(finca, orden, fin, [True] * len(orden), ventana, max_bloque, max_pasadas)
+    return orden, costo
+
+
+REGLAS = ("cociente", "edd", "wspt", "mdd", "atc")
+REGLAS_DINAMICAS = ("mdd", "atc")
+REGLAS_ESTATICAS = ("cociente", "edd", "wspt")
+# Por encima de este número de tablones el portafolio por defecto omite las
+# reglas dinámicas, que cuestan O(n²): con 2 000 ambas suman unos 0.2 s
+MAX_TABLONES_DINAMICAS = 2_000
+
+
+def costo_orden(datos, orden):
+    """Costo total de un orden con NumPy: suma acumulada de tr y penalización
+    enmascarada, sobre `datos` como arreglo (n, 3) de [ts, tr, p]."""
+    ts, tr, p = datos[orden, 0], datos[orden, 1], datos[orden, 2]
+    fin_riego = np.cumsum(tr)
+    return int((p * np.maximum(0, fin_riego - ts)).sum())
+
+
+def _despacho_dinamico(datos, indice):
+    """
+    Reglas que dependen del instante actual: en cada paso se riega el tablón
+    pendiente con menor `indice(t, ts, tr, p)` (empates: menor índice).
+
+    El índice cambia con t, así que cada paso lo reevalúa sobre toda la finca
+    (los ya regados quedan en +inf): pasos vectorizados pero O(n²) en total.
+    Por eso el portafolio por defecto las omite en fincas grandes.
+    """
+    n = len(datos)
+    ts, tr, p = datos[:, 0], datos[:, 1], datos[:, 2]
+    regado = np.zeros(n, dtype=bool)
+    tiempo = 0
+    orden = np.empty(n, dtype=np.intp)
+    for k in range(n):
+        j = int(np.argmin(np.where(regado, np.inf, indice(tiempo, ts, tr, p))))
+        orden[k] = j
+        regado[j] = True
+        tiempo += tr[j]
+    return orden
+
+
+def clave_cociente(ts, tr, p):
+    """Clave voraz ts / (p * tr) sobre columnas NumPy. Un tablón con tr = 0
+    no retrasa a nadie y termina en cuanto empieza: va primero (-inf)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(tr == 0, -np.inf, ts / (p * tr))
+
+
+def roPV_columnas(ts, tr, p):
+    """Algoritmo voraz sobre columnas NumPy, para fincas de millones de tablones.
+
+    Sin objetos de Python por tablón: la clave sale de clave_cociente, el
+    orden de un argsort estable (mismo orden que roPV) y el costo de una
+    suma acumulada de tr con la penalización enmascarada.
+
+    Parámetros:
+        ts, tr, p: arreglos enteros de igual largo (ver io_utils.leer_finca_columnas)
+
+    Retorna:
+        (orden, costo_total), con orden un arreglo de índices"""
+    ts = np.asarray(ts, dtype=np.int64)
+    tr = np.asarray(tr, dtype=np.int64)
+    p = np.asarray(p, dtype=np.int64)
+
+    orden = np.argsort(clave_cociente(ts, tr, p), kind='stable')
+    fin_riego = np.cumsum(tr[orden])
+    retraso = fin_riego - ts[orden]
+    atrasados = retraso > 0
+    costo = int((p[orden][atrasados] * retraso[atrasados]).sum())
+
+    return orden, costo
+
+
+def orden_regla(datos, regla, k_atc=2.0):
+    """
+    Orden de riego según una regla de despacho.
+
+    Reglas (menor clave primero, orden estable):
+        - "cociente": ts / (p * tr), la de roPV
+        - "edd": ts (fecha límite más temprana)
+        - "wspt": tr / p (mayor prioridad por unidad de riego)
+        - "mdd": max(tr, ts - t) / p en el instante t (fecha límite modificada)
+        - "atc": mayor (p / tr) * exp(-max(0, ts - tr - t) / (k_atc * tr medio))
+                 en el instante t (costo aparente de atraso)
+
+    Los tablones con tr = 0 van primero en "cociente" (no retrasan a nadie).
+    """
+    ts, tr, p = datos[:, 0], datos[:, 1], datos[:, 2]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if regla == "cociente":
+            clave = clave_cociente(ts, tr, p)
+        elif regla == "edd":
+            clave = ts
+        elif regla == "wspt":
+            clave = tr / p
+        elif regla == "mdd":
+            return _despacho_dinamico(datos, lambda t, ts, tr, p: np.maximum(tr, ts - t) / p)
+        elif regla == "atc":
+            escala = k_atc * max(tr.mean(), 1) if len(tr) else 1
+            return _despacho_dinamico(datos, lambda t, ts, tr, p: -(
+                p / tr * np.exp(-np.maximum(0, ts - tr - t) / escala)))
+        else:
+            raise ValueError(f"Regla de despacho desconocida: {regla}")
+
+    return np.argsort(clave, kind='stable')
+
+
+def _evaluar_regla(datos, regla, k_atc):
+    """Orden y costo de una regla (función de módulo para el pool de procesos)."""
+    orden = orden_regla(datos, regla, k_atc)
+    return orden.tolist(), costo_orden(datos, orden)
+
+
+def portafolio(finca, reglas=None, k_atc=2.0, procesos=None):
+    """Evalúa varias reglas de despacho y se queda con el orden más barato.
+
+    Sin `reglas` se usan todas las de REGLAS, salvo las dinámicas (O(n²))
+    cuando la finca tiene más de MAX_TABLONES_DINAMICAS tablones. Con
+    `procesos` las reglas se reparten en un ProcessPoolExecutor, una por
+    proceso. Ante empates gana la primera regla de `reglas`.
+
+    Retorna:
+        (orden, costo_total, regla_ganadora)"""
+    datos = np.asarray(finca, dtype=np.int64).reshape(-1, 3)
+
+    if reglas is None:
+        reglas = REGLAS
+        if len(datos) > MAX_TABLONES_DINAMICAS:
+            reglas = REGLAS_ESTATICAS
+    if len(reglas) == 0:
+        raise ValueError("El portafolio necesita al menos una regla de despacho")
+    desconocidas = [r for r in reglas if r not in REGLAS]
+    if desconocidas:
+        raise ValueError(f"Reglas de despacho desconocidas: {desconocidas}; opciones: {REGLAS}")
+
+    if procesos:
+        with ProcessPoolExecutor(max_workers=procesos) as executor:
+            resultados = list(executor.map(_evaluar_regla, [datos] * len(reglas), reglas,
+                                           [k_atc] * len(reglas)))
+    else:
+        resultados = [_evaluar_regla(datos, regla, k_atc) for regla in reglas]
+
+    mejor = min(range(len(reglas)), key=lambda k: resultados[k][1])
+    orden, costo = resultados[mejor]
+    return orden, costo, reglas[mejor]
+
+
+def roPV(f, reducir=False, mejorar=False, reglas=None, k_atc=2.0, procesos=None):
     """Algoritmo voraz para el plan de riego óptimo.
-        Estrategia: ordenar los tablones por ts / (p * tr) (menor primero).
+        Estrategia: ordenar los tablones por ts / (p * tr) (menor primero;
+        los de tr = 0 van al principio).
     
     Parámetros:
         finca: lista de tuplas (ts, tr, p)
+        reducir: fijar antes los tablones de posición conocida
+                 (reduccion.reducir) y ordenar solo el núcleo
+        mejorar: pulir el orden voraz con busqueda_local
+        reglas: reglas de despacho a probar (ver orden_regla); se usa la
+                más barata. Por defecto solo el cociente ts / (p * tr)
+        k_atc: parámetro de anticipación de la regla "atc"
+        procesos: evaluar las reglas en paralelo con este número de procesos
     
     Retorna:
         (orden, costo_total)"""
     
-    # Calculamos la clave voraz para cada tablón
-    claves = []
-    for i, (ts, tr, p) in enumerate(f):
-        clave = ts / (p * tr)
-        claves.append((clave, i))
-    
-    # Ordenamos por la clave (de menor a mayor)
-    claves.sort(key=lambda x: x[0])
-    
-    # Obtenemos el orden de índices según el criterio voraz
-    orden = [i for (_, i) in claves]
+    if reducir:
+        return resolver_reducido(f, lambda nucleo: roPV(nucleo, mejorar=mejorar, reglas=reglas,
+                                                        k_atc=k_atc, procesos=procesos))
+
+    if reglas is not None:
+        orden, costo, _ = portafolio(f, reglas, k_atc, procesos)
+        if mejorar:
+            return busqueda_local(f, orden)
+        return (orden, costo)
+
+    # Clave, orden y costo vectorizados sobre las columnas de la finca
+    datos = np.asarray(f, dtype=np.int64).reshape(-1, 3)
+    orden, costo = roPV_columnas(datos[:, 0], datos[:, 1], datos[:, 2])
+    orden = orden.tolist()
     
-    # Calculamos el costo total usando la función auxiliar
-    costo = costo_total(f, orden)
+    if mejorar:
+        return busqueda_local(f, orden)
     
     return (orden, costo)
 
@@ -1,5 +1,19 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
+from multiprocessing import shared_memory
 from pathlib import Path
+import math
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from project1_ada2.dominancia import ideales_por_capa, precedencias as calcular_precedencias
+from project1_ada2.reduccion import resolver_reducido
 
 
 def calcular_costo_tab(finca, perm):
@@ -22,12 +36,14 @@ def calcular_costo_tab(finca, perm):
     return costo_total
 
 
-def roPD(finca):
+def roPD_memo(finca, registro=None):
     """
     Programación Dinámica (Top-Down con Memoization)
     para resolver el problema del riego óptimo.
 
     Utiliza DP sobre subconjuntos (bitmask DP).
+    Si se pasa un dict `registro`, se anotan en él los estados, transiciones
+    y aciertos/fallos del lru_cache al terminar dp(0, 0).
     Retorna: (mejor_perm, mejor_costo)
     """
     n = len(finca)
@@ -82,11 +98,747 @@ def roPD(finca):
    
     # Resultado final
     mejor_costo = dp(0, 0)
+
+    if registro is not None:
+        # Cada transición es una llamada a dp (acierto o fallo), salvo la raíz
+        info = dp.cache_info()
+        registro.update(estados=info.misses, transiciones=info.hits + info.misses - 1,
+                        aciertos_cache=info.hits, fallos_cache=info.misses, tiempo_por_capa={})
+
     mejor_perm = reconstruir(0, 0)
 
     return mejor_perm, mejor_costo
 
 
+def sumas_tr(finca):
+    """
+    Tabla de sumas de subconjuntos de tr: suma_tr[mask] es el tiempo que toma
+    regar los tablones de 'mask', que es justamente el instante en que
+    empieza el siguiente riego después de ellos.
+
+    Se llena en O(2^n) quitando el bit más bajo de cada máscara.
+    """
+    n = len(finca)
+    suma_tr = array('q', bytes(8 * (1 << n)))
+
+    for mask in range(1, 1 << n):
+        bajo = mask & -mask
+        suma_tr[mask] = suma_tr[mask ^ bajo] + finca[bajo.bit_length() - 1][1]
+
+    return suma_tr
+
+
+def leer_padres(padre, n):
+    """
+    Lee la permutación óptima desde la tabla de padres en O(n): padre[mask]
+    es el tablón que conviene regar a continuación cuando ya se regó 'mask'.
+    """
+    mejor_perm = []
+    mask = 0
+    for _ in range(n):
+        i = int(padre[mask])
+        mejor_perm.append(i)
+        mask |= 1 << i
+    return mejor_perm
+
+
+def roPD_arreglo(finca):
+    """
+    Programación Dinámica (Bottom-Up) indexada solo por la máscara.
+
+    El tiempo actual queda determinado por la máscara (es suma_tr[mask]), así
+    que el estado dp(mask, tiempo_actual) de roPD_memo es redundante: basta un
+    arreglo plano array('q') de 2^n enteros donde resto[mask] es el costo
+    mínimo de regar los tablones que faltan. Se llena de la máscara llena
+    hacia la vacía, sin recursión ni tabla hash: 17 bytes por estado (8 de
+    resto, 8 de la tabla de tiempos y 1 de padre).
+
+    Mientras se llena la tabla se guarda en padre[mask] (un byte por estado)
+    el primer tablón (menor índice) que alcanza el óptimo, igual que el
+    criterio de roPD_memo, así que ambas devuelven la misma permutación y
+    esta se lee en O(n) sin volver a evaluar transiciones.
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    n = len(finca)
+    lleno = (1 << n) - 1
+    suma_tr = sumas_tr(finca)
+    resto = array('q', bytes(8 * (1 << n)))
+    padre = array('B', bytes(1 << n))
+
+    for mask in range(lleno - 1, -1, -1):
+        tiempo_actual = suma_tr[mask]
+        mejor_costo = None
+
+        libres = lleno ^ mask
+        while libres:
+            bit = libres & -libres
+            libres ^= bit
+            i = bit.bit_length() - 1
+            ts, tr, p = finca[i]
+            costo_total = p * max(0, tiempo_actual + tr - ts) + resto[mask | bit]
+            if mejor_costo is None or costo_total < mejor_costo:
+                mejor_costo = costo_total
+                padre[mask] = i
+
+        resto[mask] = mejor_costo
+
+    return leer_padres(padre, n), resto[0]
+
+
+def tablas_numpy(finca):
+    """
+    Versión NumPy de sumas_tr junto con el popcount de cada máscara.
+
+    Ambas tablas se construyen por duplicación: las máscaras que contienen
+    el bit i son las de la mitad inferior con ese bit añadido.
+
+    Retorna: (suma_tr, popcount) como arreglos de 2^n elementos
+    """
+    n = len(finca)
+    suma_tr = np.zeros(1 << n, dtype=np.int64)
+    popcount = np.zeros(1 << n, dtype=np.int8)
+
+    for i in range(n):
+        bit = 1 << i
+        suma_tr[bit:2 * bit] = suma_tr[:bit] + finca[i][1]
+        popcount[bit:2 * bit] = popcount[:bit] + 1
+
+    return suma_tr, popcount
+
+
+def resolver_lote(finca, mascaras, suma_tr, resto, padre):
+    """
+    Resuelve en bloque un grupo de máscaras de una misma capa de popcount.
+
+    Para cada tablón i se reúnen las máscaras que no lo contienen, se calcula
+    su candidato con np.maximum sobre los tiempos y se actualiza el mínimo
+    (mejora estricta, así que ante empates se queda el menor índice). Escribe
+    resto[mascaras] y padre[mascaras]; solo lee estados de la capa siguiente.
+    """
+    tiempos = suma_tr[mascaras]
+    mejor = np.full(len(mascaras), np.iinfo(np.int64).max, dtype=np.int64)
+    eleccion = np.zeros(len(mascaras), dtype=np.uint8)
+
+    for i, (ts, tr, p) in enumerate(finca):
+        bit = 1 << i
+        libre = np.flatnonzero((mascaras & bit) == 0)
+        candidato = (p * np.maximum(0, tiempos[libre] + (tr - ts))
+                     + resto[mascaras[libre] | bit])
+        mejora = candidato < mejor[libre]
+        posiciones = libre[mejora]
+        mejor[posiciones] = candidato[mejora]
+        eleccion[posiciones] = i
+
+    resto[mascaras] = mejor
+    padre[mascaras] = eleccion
+
+
+def roPD_numpy(finca, registro=None):
+    """
+    Programación Dinámica bottom-up vectorizada por capas de popcount.
+
+    Todas las máscaras con el mismo número de tablones regados dependen solo
+    de la capa siguiente, así que cada capa se procesa como un único lote con
+    resolver_lote. Las O(n·2^n) transiciones se ejecutan en NumPy en lugar del bucle
+    interpretado de roPD_arreglo, con el mismo resultado. La mejor elección
+    de cada estado queda en una tabla de padres uint8 de 2^n bytes.
+
+    Si se pasa un dict `registro`, se anotan en él los estados, transiciones
+    y el tiempo de cada capa.
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    n = len(finca)
+    suma_tr, popcount = tablas_numpy(finca)
+    resto = np.zeros(1 << n, dtype=np.int64)
+    padre = np.zeros(1 << n, dtype=np.uint8)
+    tiempo_por_capa = {}
+
+    for capa in range(n - 1, -1, -1):
+        inicio = time.perf_counter()
+        mascaras = np.flatnonzero(popcount == capa)
+        resolver_lote(finca, mascaras, suma_tr, resto, padre)
+        tiempo_por_capa[capa] = time.perf_counter() - inicio
+
+    if registro is not None:
+        # Cada máscara de la capa k evalúa sus n - k tablones pendientes
+        registro.update(estados=1 << n, transiciones=n << (n - 1) if n else 0,
+                        aciertos_cache=None, fallos_cache=None, tiempo_por_capa=tiempo_por_capa)
+
+    return leer_padres(padre, n), int(resto[0])
+
+
+# Tablas compartidas que ve cada proceso hijo del modo paralelo
+_tablas_compartidas = {}
+
+
+def _abrir_compartidas(nombres, n):
+    """Asocia los bloques de memoria compartida a arreglos NumPy."""
+    bloques = {clave: shared_memory.SharedMemory(name=nombre) for clave, nombre in nombres.items()}
+    tablas = {
+        "suma_tr": np.ndarray(1 << n, dtype=np.int64, buffer=bloques["suma_tr"].buf),
+        "orden": np.ndarray(1 << n, dtype=np.uint32, buffer=bloques["orden"].buf),
+        "resto": np.ndarray(1 << n, dtype=np.int64, buffer=bloques["resto"].buf),
+        "padre": np.ndarray(1 << n, dtype=np.uint8, buffer=bloques["padre"].buf),
+    }
+    return bloques, tablas
+
+
+def _inicializar_trabajador(finca, nombres):
+    """Abre en el proceso hijo las tablas creadas por roPD_paralelo."""
+    bloques, tablas = _abrir_compartidas(nombres, len(finca))
+    _tablas_compartidas["finca"] = finca
+    _tablas_compartidas["bloques"] = bloques
+    _tablas_compartidas.update(tablas)
+
+
+def _resolver_trozo(inicio, fin):
+    """Resuelve las máscaras orden[inicio:fin], todas de una misma capa."""
+    t = _tablas_compartidas
+    mascaras = t["orden"][inicio:fin].astype(np.int64)
+    resolver_lote(t["finca"], mascaras, t["suma_tr"], t["resto"], t["padre"])
+
+
+def roPD_paralelo(finca, procesos=None):
+    """
+    Programación Dinámica por capas repartida entre varios procesos.
+
+    Las tablas de tiempos, costos y padres viven en
+    multiprocessing.shared_memory junto con la lista de máscaras ordenada por
+    popcount. Cada capa se divide en trozos contiguos que los procesos
+    resuelven con resolver_lote; el mapa de cada capa termina antes de lanzar
+    la siguiente, que es la única sincronización necesaria. El resultado es
+    idéntico al de roPD_numpy.
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    n = len(finca)
+    procesos = procesos or os.cpu_count()
+    suma_tr, popcount = tablas_numpy(finca)
+
+    # Máscaras ordenadas por capa (y de menor a mayor dentro de cada capa)
+    orden = np.argsort(popcount, kind='stable').astype(np.uint32)
+    limites = np.concatenate(([0], np.cumsum(np.bincount(popcount, minlength=n + 1))))
+
+    tamanios = {"suma_tr": 8 << n, "orden": 4 << n, "resto": 8 << n, "padre": 1 << n}
+    bloques = {clave: shared_memory.SharedMemory(create=True, size=tamanio)
+               for clave, tamanio in tamanios.items()}
+    tablas = None
+    try:
+        nombres = {clave: bloque.name for clave, bloque in bloques.items()}
+        _, tablas = _abrir_compartidas(nombres, n)
+        tablas["suma_tr"][:] = suma_tr
+        tablas["orden"][:] = orden
+        tablas["resto"][:] = 0
+        tablas["padre"][:] = 0
+        del suma_tr, orden
+
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=_inicializar_trabajador,
+                                 initargs=(finca, nombres)) as ejecutor:
+            for capa in range(n - 1, -1, -1):
+                inicio, fin = int(limites[capa]), int(limites[capa + 1])
+                cortes = np.linspace(inicio, fin, min(procesos, fin - inicio) + 1).astype(int)
+                # Esperar a toda la capa antes de seguir (barrera entre capas)
+                list(ejecutor.map(_resolver_trozo, cortes[:-1], cortes[1:]))
+
+        mejor_perm = leer_padres(tablas["padre"], n)
+        mejor_costo = int(tablas["resto"][0])
+    finally:
+        # Soltar las vistas NumPy antes de cerrar los bloques
+        tablas = None
+        for bloque in bloques.values():
+            bloque.close()
+            bloque.unlink()
+
+    return mejor_perm, mejor_costo
+
+
+def mascaras_capa(n, capa, inicio=0, fin=None):
+    """
+    Máscaras de n bits con `capa` bits encendidos cuyo rango colex está en
+    [inicio, fin), en orden creciente.
+
+    En orden colexicográfico el rango de {b_1 < ... < b_k} es
+    Σ C(b_j, j), y coincide con el orden numérico de las máscaras, así que
+    se decodifica de forma vectorizada buscando bit por bit el mayor b con
+    C(b, j) <= rango restante.
+    """
+    if fin is None:
+        fin = math.comb(n, capa)
+
+    rangos = np.arange(inicio, fin, dtype=np.int64)
+    mascaras = np.zeros(len(rangos), dtype=np.int64)
+
+    for j in range(capa, 0, -1):
+        binomiales = np.array([math.comb(b, j) for b in range(n)], dtype=np.int64)
+        bits = np.searchsorted(binomiales, rangos, side='right') - 1
+        mascaras |= np.left_shift(1, bits)
+        rangos -= binomiales[bits]
+
+    return mascaras
+
+
+def rango_colex(mask):
+    """Rango de 'mask' dentro de su capa de popcount (orden colexicográfico)."""
+    rango = 0
+    j = 0
+    while mask:
+        bajo = mask & -mask
+        j += 1
+        rango += math.comb(bajo.bit_length() - 1, j)
+        mask ^= bajo
+    return rango
+
+
+def tiempos_capa(finca, mascaras):
+    """Suma de tr de cada máscara de un arreglo, sin tabla de 2^n entradas."""
+    tiempos = np.zeros(len(mascaras), dtype=np.int64)
+    for i, (_, tr, _) in enumerate(finca):
+        tiempos += ((mascaras >> i) & 1) * tr
+    return tiempos
+
+
+def retroceder_capa(finca, mascaras, superiores, siguiente, predecesores=None):
+    """
+    Igual que resolver_lote, pero con la capa siguiente guardada en orden
+    colex: `siguiente[r]` es el costo restante de `superiores[r]`, y cada
+    transición se ubica con np.searchsorted. Con `predecesores` solo se
+    riega i cuando todos sus predecesores ya están en la máscara.
+
+    Retorna: (mejor, eleccion) alineados con `mascaras`
+    """
+    tiempos = tiempos_capa(finca, mascaras)
+    mejor = np.full(len(mascaras), np.iinfo(np.int64).max, dtype=np.int64)
+    eleccion = np.zeros(len(mascaras), dtype=np.uint8)
+
+    for i, (ts, tr, p) in enumerate(finca):
+        bit = 1 << i
+        permitida = (mascaras & bit) == 0
+        if predecesores is not None:
+            permitida &= (mascaras & predecesores[i]) == predecesores[i]
+        libre = np.flatnonzero(permitida)
+        rangos = np.searchsorted(superiores, mascaras[libre] | bit)
+        candidato = p * np.maximum(0, tiempos[libre] + (tr - ts)) + siguiente[rangos]
+        mejora = candidato < mejor[libre]
+        posiciones = libre[mejora]
+        mejor[posiciones] = candidato[mejora]
+        eleccion[posiciones] = i
+
+    return mejor, eleccion
+
+
+def avanzar_capa(finca, mascaras, inferiores, anterior):
+    """
+    Paso hacia adelante: costo mínimo de regar primero exactamente los
+    tablones de cada máscara, a partir de la capa anterior (en orden colex).
+    El último tablón regado del conjunto termina en la suma de sus tr.
+
+    Retorna: arreglo de costos alineado con `mascaras`
+    """
+    tiempos = tiempos_capa(finca, mascaras)
+    mejor = np.full(len(mascaras), np.iinfo(np.int64).max, dtype=np.int64)
+
+    for i, (ts, tr, p) in enumerate(finca):
+        bit = 1 << i
+        con_i = np.flatnonzero(mascaras & bit)
+        rangos = np.searchsorted(inferiores, mascaras[con_i] ^ bit)
+        candidato = p * np.maximum(0, tiempos[con_i] - ts) + anterior[rangos]
+        np.minimum.at(mejor, con_i, candidato)
+
+    return mejor
+
+
+def estado_medio(finca, capa_media):
+    """
+    Conjunto de `capa_media` tablones regados por el que pasa un orden óptimo.
+
+    Recorre hacia adelante desde el conjunto vacío y hacia atrás desde el
+    conjunto lleno guardando solo dos capas a la vez; en la capa media el
+    costo adelante más el costo restante es el costo total del mejor orden
+    que pasa por cada máscara.
+
+    Retorna: (mascara_media, costo_optimo)
+    """
+    n = len(finca)
+
+    inferiores = mascaras_capa(n, 0)
+    anterior = np.zeros(1, dtype=np.int64)
+    for capa in range(1, capa_media + 1):
+        mascaras = mascaras_capa(n, capa)
+        anterior = avanzar_capa(finca, mascaras, inferiores, anterior)
+        inferiores = mascaras
+
+    superiores = mascaras_capa(n, n)
+    siguiente = np.zeros(1, dtype=np.int64)
+    for capa in range(n - 1, capa_media - 1, -1):
+        mascaras = mascaras_capa(n, capa)
+        siguiente, _ = retroceder_capa(finca, mascaras, superiores, siguiente)
+        superiores = mascaras
+
+    total = anterior + siguiente
+    j = int(np.argmin(total))
+    return int(inferiores[j]), int(total[j])
+
+
+def _ordenar_dos_capas(finca, indices, tiempo_inicial, umbral):
+    """
+    Orden óptimo de los tablones `indices` empezando a regar en
+    `tiempo_inicial`. Se resuelve como una subfinca con los ts corridos; si es
+    pequeña se usa la tabla completa, si no se parte por el estado medio.
+
+    Retorna: (orden, costo) con el costo de la subfinca
+    """
+    subfinca = [[finca[i][0] - tiempo_inicial, finca[i][1], finca[i][2]] for i in indices]
+
+    if len(indices) <= umbral:
+        orden, costo = roPD_numpy(subfinca)
+        return [indices[j] for j in orden], costo
+
+    media, costo = estado_medio(subfinca, len(indices) // 2)
+    primeros = [indices[j] for j in range(len(indices)) if media >> j & 1]
+    ultimos = [indices[j] for j in range(len(indices)) if not media >> j & 1]
+    tiempo_medio = tiempo_inicial + sum(finca[i][1] for i in primeros)
+
+    orden_primeros, _ = _ordenar_dos_capas(finca, primeros, tiempo_inicial, umbral)
+    orden_ultimos, _ = _ordenar_dos_capas(finca, ultimos, tiempo_medio, umbral)
+    return orden_primeros + orden_ultimos, costo
+
+
+def roPD_dos_capas(finca, umbral=12):
+    """
+    Programación Dinámica guardando solo dos capas de popcount a la vez.
+
+    La memoria pasa de 2^n entradas a unas C(n, n/2). Como no hay tabla de
+    padres, el orden se recupera al estilo Hirschberg: estado_medio da el
+    conjunto de tablones regados en la mitad de un orden óptimo y cada mitad
+    se resuelve recursivamente (la segunda empezando en la suma de tr de la
+    primera). Las subfincas de hasta `umbral` tablones usan roPD_numpy. El
+    tiempo es del orden de dos pasadas completas por la capa superior.
+
+    El costo es el óptimo, pero ante empates el orden puede diferir del de
+    los demás modos.
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    n = len(finca)
+    if n <= umbral:
+        return roPD_numpy(finca)
+
+    return _ordenar_dos_capas(finca, list(range(n)), 0, umbral)
+
+
+def roPD_disco(finca, directorio=None, tam_trozo=1 << 20):
+    """
+    Programación Dinámica por capas con las tablas en disco (np.memmap).
+
+    Las tablas de costos y padres se guardan ordenadas por capa de popcount
+    y, dentro de cada capa, por rango colexicográfico. Así cada capa ocupa un
+    bloque contiguo del archivo: se escribe de corrido y solo lee el bloque
+    de la capa siguiente, con índices crecientes, de modo que el acceso a
+    páginas es casi secuencial. En memoria solo viven las máscaras de la capa
+    siguiente (para ubicar cada transición con np.searchsorted) y trozos de
+    `tam_trozo` máscaras de la capa actual. Los archivos temporales se crean
+    en `directorio` (o el temporal del sistema) y se borran al terminar.
+
+    Misma elección ante empates que roPD_numpy, así que la respuesta coincide.
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    n = len(finca)
+    tamanios = [math.comb(n, capa) for capa in range(n + 1)]
+    desplazamientos = [0]
+    for tamanio in tamanios:
+        desplazamientos.append(desplazamientos[-1] + tamanio)
+
+    carpeta = tempfile.mkdtemp(prefix="roPD_", dir=directorio)
+    resto = padre = None
+    try:
+        resto = np.memmap(os.path.join(carpeta, "resto.dat"), dtype=np.int64, mode="w+", shape=(1 << n,))
+        padre = np.memmap(os.path.join(carpeta, "padre.dat"), dtype=np.uint8, mode="w+", shape=(1 << n,))
+
+        # Capa n: todos regados, costo restante 0
+        resto[desplazamientos[n]] = 0
+        superiores = mascaras_capa(n, n).astype(np.uint32)
+
+        for capa in range(n - 1, -1, -1):
+            siguiente = resto[desplazamientos[capa + 1]:desplazamientos[capa + 2]]
+            actuales = np.empty(tamanios[capa], dtype=np.uint32)
+
+            for inicio in range(0, tamanios[capa], tam_trozo):
+                fin = min(inicio + tam_trozo, tamanios[capa])
+                mascaras = mascaras_capa(n, capa, inicio, fin)
+                actuales[inicio:fin] = mascaras
+                mejor, eleccion = retroceder_capa(finca, mascaras, superiores, siguiente)
+
+                base = desplazamientos[capa]
+                resto[base + inicio:base + fin] = mejor
+                padre[base + inicio:base + fin] = eleccion
+
+            superiores = actuales
+
+        # Reconstrucción: padre de cada máscara ubicado por capa y rango
+        mejor_perm = []
+        mask = 0
+        for capa in range(n):
+            i = int(padre[desplazamientos[capa] + rango_colex(mask)])
+            mejor_perm.append(i)
+            mask |= 1 << i
+        mejor_costo = int(resto[0])
+    finally:
+        # Cerrar los memmap antes de borrar sus archivos
+        del resto, padre
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+    return mejor_perm, mejor_costo
+
+
+def roPD_ideales(finca, predecesores):
+    """
+    Programación Dinámica restringida a un DAG de precedencias.
+
+    Solo se guardan los conjuntos de regados compatibles con el DAG (sus
+    ideales de orden, ver dominancia.ideales_por_capa), capa por capa y en
+    orden creciente, y desde cada uno solo se riegan tablones con todos sus
+    predecesores ya regados. Si el DAG respeta un orden óptimo (como el de
+    dominancia.precedencias) el costo es el óptimo.
+
+    Retorna: (mejor_perm, mejor_costo)
+    """
+    n = len(finca)
+    capas = ideales_por_capa(predecesores)
+
+    siguiente = np.zeros(1, dtype=np.int64)
+    elecciones = [None] * n
+    for capa in range(n - 1, -1, -1):
+        siguiente, elecciones[capa] = retroceder_capa(finca, capas[capa], capas[capa + 1],
+                                                      siguiente, predecesores)
+
+    mejor_perm = []
+    mask = 0
+    for capa in range(n):
+        i = int(elecciones[capa][np.searchsorted(capas[capa], mask)])
+        mejor_perm.append(i)
+        mask |= 1 << i
+
+    return mejor_perm, int(siguiente[0])
+
+
+def avanzar_lote(finca, mascaras, suma_tr, costo, ultimo):
+    """
+    Versión hacia adelante de resolver_lote: costo[mask] es el mínimo de
+    regar primero exactamente los tablones de 'mask' y ultimo[mask] el tablón
+    que se riega al final de ese prefijo. Solo lee la capa anterior.
+    """
+    tiempos = suma_tr[mascaras]
+    mejor = np.full(len(mascaras), np.iinfo(np.int64).max, dtype=np.int64)
+    eleccion = np.zeros(len(mascaras), dtype=np.uint8)
+
+    for i, (ts, _, p) in enumerate(finca):
+        bit = 1 << i
+        con_i = np.flatnonzero(mascaras & bit)
+        candidato = p * np.maximum(0, tiempos[con_i] - ts) + costo[mascaras[con_i] ^ bit]
+        mejora = candidato < mejor[con_i]
+        posiciones = con_i[mejora]
+        mejor[posiciones] = candidato[mejora]
+        eleccion[posiciones] = i
+
+    costo[mascaras] = mejor
+    ultimo[mascaras] = eleccion
+
+
+def mascaras_con(n, i):
+    """Las 2^(n-1) máscaras de n bits que contienen el bit i, en orden creciente."""
+    resto_bits = np.arange(1 << (n - 1), dtype=np.int64)
+    bajos = resto_bits & ((1 << i) - 1)
+    altos = (resto_bits >> i) << (i + 1)
+    return altos | bajos | (1 << i)
+
+
+class SesionPD:
+    """
+    Sesión de Programación Dinámica que conserva la tabla entre consultas.
+
+    Usa la formulación hacia adelante: costo[mask] solo depende de los
+    tablones de 'mask', así que al editar, agregar o quitar el tablón k los
+    estados que no contienen a k siguen siendo válidos:
+
+        - actualizar(k, tablon): recalcula solo las 2^(n-1) máscaras con k
+        - agregar(tablon): el nuevo tablón es el bit n; la mitad inferior de
+          la tabla se conserva y solo se calcula la superior
+        - quitar(k): basta con quedarse con las máscaras sin k (sin recálculo)
+
+    Cada consulta devuelve (mejor_perm, mejor_costo) leyendo la tabla de
+    últimos tablones en O(n). El costo coincide con roPD; ante empates el
+    orden puede ser otro.
+
+    Ejemplo:
+        >>> sesion = SesionPD([[10, 3, 4], [5, 3, 3], [2, 2, 1]])
+        >>> perm, costo = sesion.actualizar(1, [8, 3, 3])
+    """
+
+    def __init__(self, finca):
+        self.finca = [list(tablon) for tablon in finca]
+        n = len(self.finca)
+        self.suma_tr, self.popcount = tablas_numpy(self.finca)
+        self.costo = np.zeros(1 << n, dtype=np.int64)
+        self.ultimo = np.zeros(1 << n, dtype=np.uint8)
+        self._recalcular(np.arange(1, 1 << n, dtype=np.int64))
+
+    def _recalcular(self, mascaras):
+        """Recalcula las máscaras dadas capa por capa, de menos a más regados."""
+        orden = np.argsort(self.popcount[mascaras], kind='stable')
+        mascaras = mascaras[orden]
+        cortes = np.flatnonzero(np.diff(self.popcount[mascaras])) + 1
+        for capa in np.split(mascaras, cortes):
+            if len(capa):
+                avanzar_lote(self.finca, capa, self.suma_tr, self.costo, self.ultimo)
+
+    def resolver(self):
+        """Orden óptimo y costo de la finca actual."""
+        n = len(self.finca)
+        mejor_perm = []
+        mask = (1 << n) - 1
+        while mask:
+            i = int(self.ultimo[mask])
+            mejor_perm.append(i)
+            mask ^= 1 << i
+        mejor_perm.reverse()
+        return mejor_perm, int(self.costo[(1 << n) - 1])
+
+    def actualizar(self, k, tablon):
+        """Cambia los parámetros [ts, tr, p] del tablón k y vuelve a resolver."""
+        n = len(self.finca)
+        delta_tr = tablon[1] - self.finca[k][1]
+        self.finca[k] = list(tablon)
+
+        mascaras = mascaras_con(n, k)
+        if delta_tr:
+            self.suma_tr[mascaras] += delta_tr
+        self._recalcular(mascaras)
+        return self.resolver()
+
+    def agregar(self, tablon):
+        """Agrega un tablón al final (índice n) y vuelve a resolver."""
+        n = len(self.finca)
+        self.finca.append(list(tablon))
+
+        self.suma_tr = np.concatenate([self.suma_tr, self.suma_tr + tablon[1]])
+        self.popcount = np.concatenate([self.popcount, self.popcount + 1])
+        self.costo = np.concatenate([self.costo, np.zeros(1 << n, dtype=np.int64)])
+        self.ultimo = np.concatenate([self.ultimo, np.zeros(1 << n, dtype=np.uint8)])
+
+        self._recalcular(np.arange(1 << n, 1 << (n + 1), dtype=np.int64))
+        return self.resolver()
+
+    def quitar(self, k):
+        """Quita el tablón k (los índices mayores bajan en uno) y vuelve a resolver."""
+        n = len(self.finca)
+        self.finca.pop(k)
+
+        sin_k = mascaras_con(n, k) ^ (1 << k)
+        self.suma_tr = self.suma_tr[sin_k]
+        self.popcount = self.popcount[sin_k]
+        self.costo = self.costo[sin_k]
+        self.ultimo = self.ultimo[sin_k]
+        self.ultimo[self.ultimo > k] -= 1
+        return self.resolver()
+
+
+def _con_estadisticas(finca, mode):
+    """
+    Ejecuta roPD_numpy o roPD_memo con registro y mide el pico de memoria
+    con tracemalloc (si ya estaba activo, se reinicia su pico).
+
+    Retorna: (mejor_perm, mejor_costo, estadisticas)
+    """
+    iniciado = not tracemalloc.is_tracing()
+    if iniciado:
+        tracemalloc.start()
+    else:
+        tracemalloc.reset_peak()
+
+    registro = {}
+    inicio = time.perf_counter()
+    try:
+        if mode == "numpy":
+            mejor_perm, mejor_costo = roPD_numpy(finca, registro)
+        else:
+            mejor_perm, mejor_costo = roPD_memo(finca, registro)
+        registro["tiempo_total"] = time.perf_counter() - inicio
+        registro["pico_memoria"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        if iniciado:
+            tracemalloc.stop()
+
+    return mejor_perm, mejor_costo, registro
+
+
+def roPD(finca, mode="numpy", procesos=None, directorio=None, precedencias=False, reducir=False,
+         estadisticas=False):
+    """
+    Programación Dinámica sobre subconjuntos para el riego óptimo.
+
+    Modos:
+        - "numpy": bottom-up vectorizado por capas de popcount
+        - "paralelo": las capas de "numpy" repartidas entre `procesos`
+                      procesos sobre memoria compartida
+        - "disco": tablas en archivos np.memmap dentro de `directorio`,
+                   para instancias cuya tabla no cabe en RAM
+        - "dos_capas": solo dos capas en memoria, orden reconstruido por
+                       divide y vencerás
+        - "arreglo": bottom-up sobre un array('q') indexado por máscara
+        - "memo": top-down con lru_cache sobre (mask, tiempo_actual)
+
+    Con precedencias=True (solo modo "numpy") se deriva primero el DAG de
+    dominancia.precedencias y se recorren solo los conjuntos compatibles.
+
+    Con reducir=True se fijan antes los tablones de posición conocida
+    (reduccion.reducir) y la tabla se construye solo sobre el núcleo.
+
+    Con estadisticas=True (modos "numpy" y "memo") se devuelve además un
+    dict con "estados", "transiciones", "aciertos_cache" y "fallos_cache"
+    (None fuera del modo "memo"), "pico_memoria" (bytes, tracemalloc),
+    "tiempo_por_capa" ({capa: segundos}, solo "numpy") y "tiempo_total".
+
+    Retorna: (mejor_perm, mejor_costo) o (mejor_perm, mejor_costo, estadisticas)
+    """
+    if estadisticas:
+        if mode not in ("numpy", "memo") or precedencias or reducir:
+            raise ValueError(f"El modo {mode} no admite estadísticas con estas opciones")
+        return _con_estadisticas(finca, mode)
+
+    if reducir:
+        return resolver_reducido(finca, lambda nucleo: roPD(nucleo, mode, procesos, directorio,
+                                                            precedencias))
+
+    if precedencias:
+        if mode != "numpy":
+            raise ValueError(f"El modo {mode} no admite precedencias")
+        return roPD_ideales(finca, calcular_precedencias(finca))
+
+    if mode == "numpy":
+        return roPD_numpy(finca)
+
+    if mode == "paralelo":
+        return roPD_paralelo(finca, procesos)
+
+    if mode == "disco":
+        return roPD_disco(finca, directorio)
+
+    if mode == "dos_capas":
+        return roPD_dos_capas(finca)
+
+    if mode == "arreglo":
+        return roPD_arreglo(finca)
+
+    if mode == "memo":
+        return roPD_memo(finca)
+
+    raise ValueError(f"Modo de programación dinámica desconocido: {mode}")
+
+
 def leer_finca(nombre_archivo):
     """
     Lee el archivo de entrada.
@@ -12,6 +12,7 @@ import sys
 from project1_ada2.io_utils import leer_finca, escribir_salida
 from project1_ada2.irrigation_planks_fb import roFB
 from project1_ada2.irrigation_planks_rov import roPV 
+from project1_ada2.irrigation_planks_ils import roILS
 
 # TODO: Descomentar cuando estén implementados
 # from project1_ada2.irrigation_planks_pd import roPD
@@ -74,7 +75,7 @@ def mostrar_menu():
     Muestra el menú de selección de algoritmo.
 
     Returns:
-        int: Opción seleccionada (1, 2, 3) o 0 para salir
+        int: Opción seleccionada (1, 2, 3, 4) o 0 para salir
     """
     print("\n" + "=" * 60)
     print("  PROBLEMA DE RIEGO ÓPTIMO - Selección de Algoritmo")
@@ -83,16 +84,17 @@ def mostrar_menu():
     print("  [1] Fuerza Bruta (FB)")
     print("  [2] Algoritmo Voraz (V)")
     print("  [3] Programación Dinámica (PD) - ⚠️ Próximamente")
+    print("  [4] Búsqueda Local Iterada (ILS) - límite de tiempo")
     print("  [0] Salir")
     print("-" * 60)
 
     while True:
         try:
-            opcion = int(input("\nSeleccione una opción (0-3): "))
-            if 0 <= opcion <= 3:
+            opcion = int(input("\nSeleccione una opción (0-4): "))
+            if 0 <= opcion <= 4:
                 return opcion
             else:
-                print("❌ Opción inválida. Por favor ingrese un número entre 0 y 3.")
+                print("❌ Opción inválida. Por favor ingrese un número entre 0 y 4.")
         except ValueError:
             print("❌ Entrada inválida. Por favor ingrese un número.")
 
@@ -102,7 +104,7 @@ def ejecutar_algoritmo(opcion, finca):
     Ejecuta el algoritmo seleccionado.
 
     Args:
-        opcion (int): Número de algoritmo (1=FB, 2=V, 3=PD)
+        opcion (int): Número de algoritmo (1=FB, 2=V, 3=PD, 4=ILS)
         finca (list): Lista de tablones
 
     Returns:
@@ -130,6 +132,11 @@ def ejecutar_algoritmo(opcion, finca):
             # perm, costo = roPD(finca)
             # return perm, costo
 
+        elif opcion == 4:
+            print("📊 Algoritmo: Búsqueda Local Iterada (5 segundos)")
+            perm, costo = roILS(finca, tiempo_limite=5.0)
+            return perm, costo
+
     except Exception as e:
         print(f"❌ Error al ejecutar el algoritmo: {str(e)}")
         return None
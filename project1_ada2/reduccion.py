@@ -0,0 +1,64 @@
+"""
+Reducción (kernelización) de la finca antes de resolver.
+
+Fija los tablones cuya posición óptima se conoce de antemano, resuelve solo
+el núcleo restante con cualquier algoritmo y vuelve a insertar los fijados en
+la permutación final.
+"""
+
+
+def reducir(finca):
+    """
+    Separa la finca en tablones fijados y núcleo.
+
+    Reglas, aplicadas hasta que ninguna se cumpla:
+        - Al final: si ts_j >= suma de tr de los tablones aún no fijados, j
+          regado de último entre ellos termina a tiempo. Llevarlo al final
+          no atrasa a nadie más, así que se fija ahí y la suma baja en tr_j.
+        - Al principio: un tablón con tr = 0 y ts >= 0 regado primero
+          termina en el instante 0 sin retrasar a los demás.
+
+    Fijar un tablón al final solo baja la suma, así que el conjunto de los
+    que se pueden fijar no depende del orden en que se fijen: basta recorrer
+    los pendientes una vez por ts decreciente y parar en el primero que no
+    cabe. En total O(n log n).
+
+    Retorna: (nucleo, al_principio, al_final), listas de índices de la finca
+             original; al_final ya está en el orden en que se riegan
+    """
+    al_principio = [i for i, (ts, tr, _) in enumerate(finca) if tr == 0 and ts >= 0]
+    fijados = set(al_principio)
+    restantes = [i for i in range(len(finca)) if i not in fijados]
+    tiempo_total = sum(finca[i][1] for i in restantes)
+
+    ts = [tablon[0] for tablon in finca]
+    al_final = []
+    for i in sorted(restantes, key=ts.__getitem__, reverse=True):
+        if ts[i] < tiempo_total:
+            break
+        al_final.append(i)
+        tiempo_total -= finca[i][1]
+
+    fijados.update(al_final)
+    al_final.reverse()
+    return [i for i in restantes if i not in fijados], al_principio, al_final
+
+
+def resolver_reducido(finca, solucionador):
+    """
+    Resuelve la finca reduciéndola primero.
+
+    `solucionador` recibe la subfinca del núcleo y devuelve una tupla que
+    empieza por (perm, costo), como roFB, roPV o roPD; los demás elementos
+    (por ejemplo un reporte) se devuelven tal cual. Los tablones fijados no
+    pagan penalización y los del principio no consumen tiempo, así que el
+    costo del núcleo es el costo total.
+
+    Retorna: (mejor_perm, mejor_costo, ...) sobre los índices originales
+    """
+    nucleo, al_principio, al_final = reducir(finca)
+    resultado = solucionador([finca[i] for i in nucleo])
+    perm_nucleo, costo = resultado[0], resultado[1]
+
+    mejor_perm = al_principio + [nucleo[j] for j in perm_nucleo] + al_final
+    return (mejor_perm, costo) + tuple(resultado[2:])
@@ -14,6 +14,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import time
 import math
+import tracemalloc
 
 # ============================================================================
 # CONFIGURACIÓN DE RUTAS
@@ -52,12 +53,12 @@ def generar_finca_aleatoria(n, seed=None):
 # MEDICIÓN DE TIEMPOS
 # ============================================================================
 
-def medir_tiempos(tamanios, repeticiones=5):
+def medir_tiempos(tamanios, repeticiones=5, mode="numpy"):
     """Mide tiempos de ejecución del algoritmo de Programación Dinámica"""
     resultados = {}
 
     print("=" * 70)
-    print("⏱️  MIDIENDO TIEMPOS DE EJECUCIÓN (PROGRAMACIÓN DINÁMICA)")
+    print(f"⏱️  MIDIENDO TIEMPOS DE EJECUCIÓN (PROGRAMACIÓN DINÁMICA, modo {mode})")
     print("=" * 70)
 
     for n in tamanios:
@@ -67,7 +68,7 @@ def medir_tiempos(tamanios, repeticiones=5):
         for rep in range(repeticiones):
             finca = generar_finca_aleatoria(n, seed=rep)
             inicio = time.perf_counter()
-            roPD(finca)
+            roPD(finca, mode=mode)
             fin = time.perf_counter()
             tiempo = fin - inicio
             tiempos.append(tiempo)
@@ -81,6 +82,75 @@ def medir_tiempos(tamanios, repeticiones=5):
     return resultados
 
 
+def medir_escalamiento(n, lista_procesos, repeticiones=3):
+    """Mide el modo paralelo de roPD con distintas cantidades de procesos"""
+    resultados = {}
+
+    print("=" * 70)
+    print(f"⏱️  ESCALAMIENTO DEL MODO PARALELO (n={n})")
+    print("=" * 70)
+
+    for procesos in lista_procesos:
+        tiempos = []
+        for rep in range(repeticiones):
+            finca = generar_finca_aleatoria(n, seed=rep)
+            inicio = time.perf_counter()
+            roPD(finca, mode="paralelo", procesos=procesos)
+            tiempos.append(time.perf_counter() - inicio)
+
+        promedio = np.mean(tiempos)
+        resultados[procesos] = {'tiempos': tiempos, 'promedio': promedio, 'std': np.std(tiempos)}
+        print(f"   {procesos} procesos: {promedio:.4f} seg")
+
+    return resultados
+
+
+def medir_memoria(tamanios, modos, repeticiones=2):
+    """Mide tiempo y pico de memoria (tracemalloc) de cada modo de roPD"""
+    resultados = {modo: {} for modo in modos}
+
+    print("=" * 70)
+    print("💾 TIEMPO Y PICO DE MEMORIA POR MODO")
+    print("=" * 70)
+
+    for n in tamanios:
+        for modo in modos:
+            tiempos = []
+            picos = []
+            for rep in range(repeticiones):
+                finca = generar_finca_aleatoria(n, seed=rep)
+                tracemalloc.start()
+                inicio = time.perf_counter()
+                roPD(finca, mode=modo)
+                tiempos.append(time.perf_counter() - inicio)
+                picos.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+                tracemalloc.stop()
+
+            resultados[modo][n] = {'promedio': np.mean(tiempos), 'pico_mb': max(picos)}
+            print(f"   n={n} {modo}: {np.mean(tiempos):.4f} seg, pico {max(picos):.1f} MB")
+
+    return resultados
+
+
+def medir_estadisticas(tamanios, modos=("numpy", "memo")):
+    """Recoge las estadísticas internas de roPD (estados, caché, memoria, capas)"""
+    resultados = {modo: {} for modo in modos}
+
+    print("=" * 70)
+    print("🔎 ESTADÍSTICAS INTERNAS DE roPD")
+    print("=" * 70)
+
+    for n in tamanios:
+        finca = generar_finca_aleatoria(n, seed=0)
+        for modo in modos:
+            _, _, stats = roPD(finca, mode=modo, estadisticas=True)
+            resultados[modo][n] = stats
+            print(f"   n={n} {modo}: {stats['estados']} estados, {stats['transiciones']} transiciones, "
+                  f"pico {stats['pico_memoria'] / 2 ** 20:.1f} MB, {stats['tiempo_total']:.4f} seg")
+
+    return resultados
+
+
 # ============================================================================
 # GRÁFICOS
 # ============================================================================
@@ -162,6 +232,145 @@ def crear_grafico_tiempo_log(resultados, carpeta_salida):
     print(f"✅ Gráfico logarítmico guardado: {ruta}")
 
 
+def crear_grafico_speedup(resultados_arreglo, resultados_numpy, carpeta_salida):
+    """Gráfico: bucle interpretado (arreglo) vs capas vectorizadas (numpy)"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    ns_arreglo = sorted(resultados_arreglo.keys())
+    ns_numpy = sorted(resultados_numpy.keys())
+
+    ax1.plot(ns_arreglo, [resultados_arreglo[n]['promedio'] for n in ns_arreglo],
+             'o-', linewidth=2.5, markersize=8, color='#EF476F', label='Bucle por máscara (arreglo)')
+    ax1.plot(ns_numpy, [resultados_numpy[n]['promedio'] for n in ns_numpy],
+             's-', linewidth=2.5, markersize=8, color='#118AB2', label='Capas de popcount (numpy)')
+    ax1.set_yscale('log')
+    ax1.set_xlabel('Tamaño de entrada (n)')
+    ax1.set_ylabel('Tiempo (s, escala log)')
+    ax1.set_title('Tiempo de ejecución por modo')
+    ax1.grid(True, which="both", linestyle='--', alpha=0.3)
+    ax1.legend()
+
+    comunes = [n for n in ns_numpy if n in resultados_arreglo]
+    speedups = [resultados_arreglo[n]['promedio'] / resultados_numpy[n]['promedio'] for n in comunes]
+    barras = ax2.bar(comunes, speedups, color='#06D6A0', edgecolor='black', linewidth=0.5)
+    for barra, valor in zip(barras, speedups):
+        ax2.annotate(f"{valor:.1f}×", (barra.get_x() + barra.get_width() / 2, barra.get_height()),
+                     ha='center', va='bottom', fontsize=9)
+    ax2.set_xlabel('Tamaño de entrada (n)')
+    ax2.set_ylabel('Aceleración (arreglo / numpy)')
+    ax2.set_title('Aceleración de la vectorización por capas')
+    ax2.set_xticks(comunes)
+    ax2.grid(True, axis='y', linestyle='--', alpha=0.3)
+
+    plt.tight_layout()
+
+    ruta = os.path.join(carpeta_salida, 'grafico_speedup_pd.png')
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    plt.close()
+    print(f"✅ Gráfico de aceleración guardado: {ruta}")
+
+
+def crear_grafico_escalamiento(resultados, n, carpeta_salida):
+    """Gráfico: aceleración del modo paralelo según la cantidad de procesos"""
+    plt.figure(figsize=(10, 6))
+
+    procesos = sorted(resultados.keys())
+    base = resultados[procesos[0]]['promedio']
+    speedups = [base / resultados[k]['promedio'] for k in procesos]
+
+    plt.plot(procesos, speedups, 'o-', linewidth=2.5, markersize=9, color='#118AB2', label='Experimental')
+    plt.plot(procesos, [k / procesos[0] for k in procesos], '--', color='lightcoral',
+             linewidth=2, label='Ideal (lineal)')
+    plt.xlabel('Procesos')
+    plt.ylabel(f'Aceleración respecto a {procesos[0]} proceso(s)')
+    plt.title(f'Programación Dinámica en paralelo por capas (n={n})')
+    plt.xticks(procesos)
+    plt.grid(True, alpha=0.3, linestyle='--')
+    plt.legend()
+    plt.tight_layout()
+
+    ruta = os.path.join(carpeta_salida, 'grafico_escalamiento_pd.png')
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    plt.close()
+    print(f"✅ Gráfico de escalamiento guardado: {ruta}")
+
+
+def crear_grafico_memoria(resultados, carpeta_salida):
+    """Gráfico: tiempo y pico de memoria de cada modo según n"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    for modo, por_n in resultados.items():
+        ns = sorted(por_n.keys())
+        ax1.plot(ns, [por_n[n]['promedio'] for n in ns], 'o-', linewidth=2.5, markersize=8, label=modo)
+        ax2.plot(ns, [por_n[n]['pico_mb'] for n in ns], 's-', linewidth=2.5, markersize=8, label=modo)
+
+    ax1.set_yscale('log')
+    ax1.set_xlabel('Tamaño de entrada (n)')
+    ax1.set_ylabel('Tiempo (s, escala log)')
+    ax1.set_title('Tiempo de ejecución por modo')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Tamaño de entrada (n)')
+    ax2.set_ylabel('Pico de memoria (MB, escala log)')
+    ax2.set_title('Pico de memoria (tracemalloc) por modo')
+    for ax in (ax1, ax2):
+        ax.grid(True, which="both", linestyle='--', alpha=0.3)
+        ax.legend()
+
+    plt.tight_layout()
+
+    ruta = os.path.join(carpeta_salida, 'grafico_memoria_pd.png')
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    plt.close()
+    print(f"✅ Gráfico de memoria guardado: {ruta}")
+
+
+def crear_grafico_estadisticas(resultados, carpeta_salida):
+    """Gráfico: transiciones, pico de memoria y tiempo por capa según roPD"""
+    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(18, 6))
+
+    for modo, por_n in resultados.items():
+        ns = sorted(por_n.keys())
+        ax1.plot(ns, [por_n[n]['transiciones'] for n in ns], 'o-', linewidth=2.5, markersize=8,
+                 label=f'{modo}: transiciones')
+        aciertos = [por_n[n]['aciertos_cache'] for n in ns]
+        if all(a is not None for a in aciertos):
+            ax1.plot(ns, aciertos, '--', linewidth=2, label=f'{modo}: aciertos de caché')
+        ax2.plot(ns, [por_n[n]['pico_memoria'] / 2 ** 20 for n in ns], 's-', linewidth=2.5,
+                 markersize=8, label=modo)
+
+    ax1.set_yscale('log')
+    ax1.set_xlabel('Tamaño de entrada (n)')
+    ax1.set_ylabel('Cantidad (escala log)')
+    ax1.set_title('Transiciones evaluadas y aciertos de caché')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Tamaño de entrada (n)')
+    ax2.set_ylabel('Pico de memoria (MB, escala log)')
+    ax2.set_title('Pico de memoria (tracemalloc)')
+
+    # Tiempo por capa de popcount del mayor n medido en modo numpy
+    por_n = resultados.get('numpy', {})
+    if por_n:
+        n_max = max(por_n)
+        capas = sorted(por_n[n_max]['tiempo_por_capa'])
+        ax3.bar(capas, [por_n[n_max]['tiempo_por_capa'][c] for c in capas],
+                color='#118AB2', edgecolor='black', linewidth=0.5)
+        ax3.set_title(f'Tiempo por capa de popcount (numpy, n={n_max})')
+    ax3.set_xlabel('Tablones regados en la capa')
+    ax3.set_ylabel('Tiempo (s)')
+
+    for ax in (ax1, ax2, ax3):
+        ax.grid(True, which="both", linestyle='--', alpha=0.3)
+    ax1.legend()
+    ax2.legend()
+
+    plt.tight_layout()
+
+    ruta = os.path.join(carpeta_salida, 'grafico_estadisticas_pd.png')
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    plt.close()
+    print(f"✅ Gráfico de estadísticas guardado: {ruta}")
+
+
 # ============================================================================
 # FUNCIÓN PRINCIPAL
 # ============================================================================
@@ -186,16 +395,42 @@ def main():
 
     resultados = medir_tiempos(tamanios, repeticiones)
 
+    # Comparación de modos en tamaños grandes (el bucle interpretado se
+    # detiene antes porque a partir de n≈21 tarda minutos)
+    tamanios_numpy = list(range(16, 25))
+    tamanios_arreglo = list(range(16, 21))
+    resultados_numpy = medir_tiempos(tamanios_numpy, 2, mode="numpy")
+    resultados_arreglo = medir_tiempos(tamanios_arreglo, 2, mode="arreglo")
+
+    # Escalamiento del modo paralelo con la cantidad de procesos
+    n_escalamiento = 22
+    lista_procesos = sorted({1, 2, 4, os.cpu_count() or 1})
+    resultados_escalamiento = medir_escalamiento(n_escalamiento, lista_procesos)
+
+    # Tiempo contra memoria: tabla completa, dos capas y tablas en disco
+    resultados_memoria = medir_memoria(list(range(16, 23, 2)), ["numpy", "dos_capas", "disco"])
+
+    # Estadísticas internas: el modo memo es lento, se limita a n pequeños
+    resultados_estadisticas = medir_estadisticas(list(range(8, 15)))
+
     print("\n📊 Generando gráficos...\n")
     crear_grafico_tiempo_lineal(resultados, carpeta_imagenes)
     crear_grafico_tiempo_log(resultados, carpeta_imagenes)
     crear_grafico_teorico_vs_experimental(resultados, carpeta_imagenes)
+    crear_grafico_speedup(resultados_arreglo, resultados_numpy, carpeta_imagenes)
+    crear_grafico_escalamiento(resultados_escalamiento, n_escalamiento, carpeta_imagenes)
+    crear_grafico_memoria(resultados_memoria, carpeta_imagenes)
+    crear_grafico_estadisticas(resultados_estadisticas, carpeta_imagenes)
 
     print("\n🎉 ¡Proceso completado!")
     print("Archivos generados en docs/imagenes/")
     print("  • grafico_tiempo_lineal_pd.png")
     print("  • grafico_tiempo_log_pd.png")
     print("  • grafico_teorico_vs_experimental_pd.png")
+    print("  • grafico_speedup_pd.png")
+    print("  • grafico_escalamiento_pd.png")
+    print("  • grafico_memoria_pd.png")
+    print("  • grafico_estadisticas_pd.png")
 
 
 if __name__ == "__main__":
@@ -14,6 +14,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import time
 import math
+import tracemalloc
 
 # ============================================================================
 # CONFIGURACIÓN DE RUTAS
@@ -27,7 +28,7 @@ print(f"📁 Proyecto: {PROJECT_ROOT}")
 print(f"📁 Buscando algoritmos en: {os.path.join(PROJECT_ROOT, 'project1_ada2')}\n")
 
 try:
-    from irrigation_planks_rov import roPV as roVZ
+    from irrigation_planks_rov import roPV as roVZ, roPV_columnas
     print("✅ Función 'roVZ' importada correctamente\n")
 except ImportError as e:
     print(f"❌ Error al importar: {e}")
@@ -163,6 +164,66 @@ def crear_grafico_tiempo_log(resultados, carpeta_salida):
     print(f"✅ Gráfico logarítmico guardado: {ruta}")
 
 
+def medir_columnas(tamanios, repeticiones=3):
+    """Mide tiempo y pico de memoria (tracemalloc) del voraz sobre columnas NumPy"""
+    resultados = {}
+
+    print("=" * 70)
+    print("⏱️  VORAZ SOBRE COLUMNAS (roPV_columnas)")
+    print("=" * 70)
+
+    for n in tamanios:
+        tiempos = []
+        picos = []
+        for rep in range(repeticiones):
+            rng = np.random.default_rng(rep)
+            ts = rng.integers(5, 15, n)
+            tr = rng.integers(1, 5, n)
+            p = rng.integers(1, 5, n)
+
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            roPV_columnas(ts, tr, p)
+            tiempos.append(time.perf_counter() - inicio)
+            picos.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+            tracemalloc.stop()
+
+        resultados[n] = {'promedio': np.mean(tiempos), 'pico_mb': max(picos)}
+        print(f"   n={n}: {np.mean(tiempos):.4f} seg, pico {max(picos):.1f} MB")
+
+    return resultados
+
+
+def crear_grafico_columnas(resultados, carpeta_salida):
+    """Gráfico: tiempo y pico de memoria del voraz sobre columnas"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    ns = sorted(resultados.keys())
+
+    ax1.plot(ns, [resultados[n]['promedio'] for n in ns], 'o-', linewidth=2.5, markersize=8, color='#118AB2')
+    ax1.set_xscale('log')
+    ax1.set_yscale('log')
+    ax1.set_xlabel('Tamaño de entrada (n, escala log)')
+    ax1.set_ylabel('Tiempo (s, escala log)')
+    ax1.set_title('Voraz sobre columnas NumPy: tiempo')
+
+    ax2.plot(ns, [resultados[n]['pico_mb'] for n in ns], 's-', linewidth=2.5, markersize=8, color='#EF476F')
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Tamaño de entrada (n, escala log)')
+    ax2.set_ylabel('Pico de memoria (MB, escala log)')
+    ax2.set_title('Voraz sobre columnas NumPy: pico de memoria (tracemalloc)')
+
+    for ax in (ax1, ax2):
+        ax.grid(True, which="both", linestyle='--', alpha=0.3)
+
+    plt.tight_layout()
+
+    ruta = os.path.join(carpeta_salida, 'grafico_columnas_vz.png')
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    plt.close()
+    print(f"✅ Gráfico de columnas guardado: {ruta}")
+
+
 # ============================================================================
 # FUNCIÓN PRINCIPAL
 # ============================================================================
@@ -186,16 +247,21 @@ def main():
 
     resultados = medir_tiempos(tamanios, repeticiones)
 
+    # Fincas de escala regional: 10^4 a 10^7 tablones
+    resultados_columnas = medir_columnas([10 ** k for k in range(4, 8)])
+
     print("\n📊 Generando gráficos...\n")
     crear_grafico_tiempo_lineal(resultados, carpeta_imagenes)
     crear_grafico_tiempo_log(resultados, carpeta_imagenes)
     crear_grafico_teorico_vs_experimental(resultados, carpeta_imagenes)
+    crear_grafico_columnas(resultados_columnas, carpeta_imagenes)
 
     print("\n🎉 ¡Proceso completado!")
     print("Archivos generados en docs/imagenes/")
     print("  • grafico_tiempo_lineal_vz.png")
     print("  • grafico_tiempo_log_vz.png")
     print("  • grafico_teorico_vs_experimental_vz.png")
+    print("  • grafico_columnas_vz.png")
 
 
 if __name__ == "__main__":
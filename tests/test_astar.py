@@ -0,0 +1,38 @@
+import random
+
+from project1_ada2.irrigation_planks_astar import roAE
+from project1_ada2.irrigation_planks_rov import costo_total
+from project1_ada2.irrigation_plants_pd import roPD
+
+
+def generar_finca(n):
+    """Genera una finca aleatoria con n tablones."""
+    return [[random.randint(0, 30), random.randint(0, 5), random.randint(1, 4)]
+            for _ in range(n)]
+
+
+# ---------------------------------------------------------------------
+# TEST 1: Mismo óptimo que la Programación Dinámica
+# ---------------------------------------------------------------------
+def test_astar_igual_a_pd():
+    random.seed(16)
+    for _ in range(20):
+        finca = generar_finca(random.randint(0, 10))
+        perm, costo = roAE(finca)
+        assert sorted(perm) == list(range(len(finca)))
+        assert costo == costo_total(finca, perm)
+        assert costo == roPD(finca)[1]
+
+
+# ---------------------------------------------------------------------
+# TEST 2: Reporte de estados expandidos
+# ---------------------------------------------------------------------
+def test_astar_reporte_expande_menos_que_pd():
+    random.seed(17)
+    finca = generar_finca(14)
+    perm, costo, reporte = roAE(finca, reporte=True)
+
+    assert costo == roPD(finca)[1]
+    assert reporte["estados_totales"] == 2 ** 14
+    assert 0 < reporte["expandidos"] <= reporte["generados"]
+    assert reporte["expandidos"] < reporte["estados_totales"]
@@ -0,0 +1,44 @@
+import math
+import random
+
+import pytest
+
+from project1_ada2.irrigation_planks_beam import roBeam
+from project1_ada2.irrigation_planks_rov import costo_total
+from project1_ada2.irrigation_plants_pd import roPD
+
+
+def generar_finca(n):
+    """Genera una finca aleatoria con n tablones."""
+    return [[random.randint(0, 5 * n), random.randint(0, 10), random.randint(1, 4)]
+            for _ in range(n)]
+
+
+# ---------------------------------------------------------------------
+# TEST 1: Permutación válida y costo correcto para cualquier ancho
+# ---------------------------------------------------------------------
+@pytest.mark.parametrize("ancho", [1, 2, 8])
+def test_beam_costo_correcto(ancho):
+    random.seed(ancho)
+    for _ in range(20):
+        finca = generar_finca(random.randint(0, 30))
+        perm, costo = roBeam(finca, ancho=ancho)
+        assert sorted(perm) == list(range(len(finca)))
+        assert costo == costo_total(finca, perm)
+
+
+# ---------------------------------------------------------------------
+# TEST 2: Con el ancho de la capa más grande coincide con roPD
+# ---------------------------------------------------------------------
+def test_beam_ancho_completo_es_optimo():
+    random.seed(25)
+    for _ in range(30):
+        finca = generar_finca(random.randint(1, 10))
+        n = len(finca)
+        _, costo = roBeam(finca, ancho=math.comb(n, n // 2))
+        assert costo == roPD(finca)[1]
+
+
+def test_beam_ancho_invalido():
+    with pytest.raises(ValueError):
+        roBeam([[1, 1, 1]], ancho=0)
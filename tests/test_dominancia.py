@@ -0,0 +1,72 @@
+import itertools
+import random
+
+from project1_ada2.dominancia import precedencias, reporte_precedencias
+from project1_ada2.irrigation_planks_fb import roFB, calcular_costo
+from project1_ada2.irrigation_plants_pd import roPD
+
+
+def generar_finca(n):
+    """Genera una finca aleatoria con n tablones (con repeticiones frecuentes)."""
+    return [[random.randint(0, 15), random.randint(0, 4), random.randint(1, 3)]
+            for _ in range(n)]
+
+
+def respeta(perm, predecesores):
+    """True si cada tablón aparece después de todos sus predecesores."""
+    regados = 0
+    for i in perm:
+        if predecesores[i] & ~regados:
+            return False
+        regados |= 1 << i
+    return True
+
+
+# ---------------------------------------------------------------------
+# TEST 1: El DAG conserva al menos un orden óptimo
+# ---------------------------------------------------------------------
+def test_precedencias_conservan_optimo():
+    random.seed(17)
+    for _ in range(100):
+        n = random.randint(1, 6)
+        finca = generar_finca(n)
+        predecesores = precedencias(finca)
+
+        costos = [calcular_costo(finca, list(perm)) for perm in itertools.permutations(range(n))]
+        compatibles = [calcular_costo(finca, list(perm)) for perm in itertools.permutations(range(n))
+                       if respeta(perm, predecesores)]
+        assert min(compatibles) == min(costos)
+
+
+# ---------------------------------------------------------------------
+# TEST 2: Los solucionadores exactos restringidos dan el mismo costo
+# ---------------------------------------------------------------------
+def test_solucionadores_con_precedencias():
+    random.seed(18)
+    for _ in range(20):
+        finca = generar_finca(random.randint(0, 8))
+        predecesores = precedencias(finca)
+        optimo = roPD(finca)[1]
+
+        for mode in ("incremental", "bnb"):
+            perm, costo = roFB(finca, mode=mode, precedencias=True)
+            assert costo == optimo
+            assert respeta(perm, predecesores)
+
+        perm, costo = roPD(finca, precedencias=True)
+        assert costo == optimo == calcular_costo(finca, perm)
+        assert respeta(perm, predecesores)
+
+
+# ---------------------------------------------------------------------
+# TEST 3: Reporte de arcos y estados eliminados
+# ---------------------------------------------------------------------
+def test_reporte_precedencias():
+    # El tablón 0 domina a los demás y el 3 nunca se atrasa
+    finca = [[1, 1, 4], [5, 2, 2], [4, 3, 1], [100, 1, 1]]
+    reporte = reporte_precedencias(finca)
+
+    assert reporte["arcos"] == 5
+    assert reporte["estados_totales"] == 16
+    assert reporte["estados"] == 6
+    assert reporte["fraccion_eliminada"] == 1 - 6 / 16
@@ -1,5 +1,10 @@
 import time
-from project1_ada2.irrigation_planks_fb import roFB, calcular_costo
+import random
+import numpy as np
+import pytest
+import project1_ada2.irrigation_planks_fb as fb
+from project1_ada2.irrigation_planks_fb import (roFB, calcular_costo, calcular_costo_lote, permute_yield,
+                                                permutaciones_heap, mejores_k, todos_optimos)
 
 def test_fuerza_bruta_basico():
     """
@@ -59,3 +64,187 @@ def test_fuerza_bruta_tiempo_pequeno():
     assert duracion < 5, "El algoritmo de fuerza bruta tarda demasiado en n pequeño"
     assert isinstance(perm, list)
     assert isinstance(costo, (int, float))
+
+
+def test_fuerza_bruta_incremental_igual_a_clasico():
+    """
+    El motor incremental recorre el mismo árbol que permute_yield, así que
+    debe devolver exactamente la misma permutación y costo que el modo clásico.
+    """
+    random.seed(7)
+    for _ in range(20):
+        n = random.randint(1, 7)
+        finca = [[random.randint(0, 12), random.randint(0, 4), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roFB(finca, mode="incremental") == roFB(finca, mode="clasico")
+
+
+def test_fuerza_bruta_bnb_igual_a_incremental():
+    """
+    La ramificación y poda no debe cambiar el resultado: misma permutación y
+    mismo costo que recorrer el árbol completo.
+    """
+    random.seed(11)
+    for _ in range(30):
+        n = random.randint(1, 8)
+        finca = [[random.randint(0, 15), random.randint(0, 5), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roFB(finca, mode="bnb") == roFB(finca, mode="incremental")
+
+
+def test_fuerza_bruta_paralelo_igual_a_serial():
+    """
+    El modo paralelo debe combinar los subárboles rompiendo empates como el
+    recorrido serial, sin importar la profundidad del reparto.
+    """
+    random.seed(3)
+    for profundidad in (1, 2, 3):
+        n = random.randint(4, 7)
+        finca = [[random.randint(0, 10), random.randint(1, 3), random.randint(1, 4)]
+                 for _ in range(n)]
+        esperado = roFB(finca, mode="incremental")
+        assert roFB(finca, mode="paralelo", procesos=2, profundidad=profundidad) == esperado
+
+
+def test_calcular_costo_lote_igual_a_calcular_costo():
+    """
+    El kernel vectorizado debe dar el mismo costo que calcular_costo en cada fila.
+    """
+    finca = [
+        [10, 3, 4],
+        [5, 3, 3],
+        [2, 2, 1],
+        [8, 1, 1],
+        [6, 4, 2]
+    ]
+    perms = list(permute_yield(list(range(len(finca)))))
+    costos = calcular_costo_lote(finca, np.array(perms))
+    assert costos.tolist() == [calcular_costo(finca, perm) for perm in perms]
+
+
+def test_fuerza_bruta_numpy_igual_a_serial():
+    """
+    El modo numpy debe devolver la misma permutación que el recorrido serial,
+    también cuando el bloque no cubre todo el sufijo.
+    """
+    random.seed(5)
+    for tam_bloque in (1, 6, 120, 5040):
+        n = random.randint(1, 7)
+        finca = [[random.randint(0, 10), random.randint(0, 3), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roFB(finca, mode="numpy", tam_bloque=tam_bloque) == roFB(finca)
+
+
+def test_permutaciones_heap_recorre_todas():
+    """
+    El enumerador de Heap debe pasar por las n! permutaciones exactamente una vez.
+    """
+    nums = list(range(5))
+    vistas = {tuple(nums)}
+    for j, i in permutaciones_heap(nums):
+        assert j < i
+        vistas.add(tuple(nums))
+    assert len(vistas) == 120
+
+
+def test_fuerza_bruta_heap_costo_optimo():
+    """
+    El modo heap puede elegir otra permutación ante empates, pero el costo
+    debe ser el óptimo y corresponder a la permutación devuelta.
+    """
+    random.seed(9)
+    for _ in range(20):
+        n = random.randint(1, 7)
+        finca = [[random.randint(0, 12), random.randint(0, 4), random.randint(1, 4)]
+                 for _ in range(n)]
+        perm, costo = roFB(finca, mode="heap")
+        assert costo == roFB(finca)[1]
+        assert calcular_costo(finca, perm) == costo
+
+
+def test_fuerza_bruta_multiconjunto_con_repetidos():
+    """
+    Con tablones repetidos, el modo multiconjunto debe encontrar el mismo costo
+    óptimo y devolver una permutación válida de índices concretos.
+    """
+    random.seed(13)
+    tipos = [[4, 2, 3], [7, 1, 1], [3, 3, 4]]
+    for _ in range(10):
+        finca = [list(random.choice(tipos)) for _ in range(random.randint(1, 8))]
+        perm, costo = roFB(finca, mode="multiconjunto")
+        assert sorted(perm) == list(range(len(finca)))
+        assert costo == calcular_costo(finca, perm) == roFB(finca, mode="bnb")[1]
+
+
+def test_mejores_k_y_todos_optimos():
+    """
+    mejores_k debe coincidir con ordenar todas las permutaciones por costo, y
+    todos_optimos debe devolver exactamente las empatadas en el mínimo.
+    """
+    random.seed(17)
+    for _ in range(10):
+        n = random.randint(1, 6)
+        finca = [[random.randint(0, 8), random.randint(1, 3), random.randint(1, 4)]
+                 for _ in range(n)]
+        todas = [(perm, calcular_costo(finca, perm)) for perm in permute_yield(list(range(n)))]
+        ordenadas = sorted(todas, key=lambda x: x[1])
+
+        assert mejores_k(finca, 4) == ordenadas[:4]
+
+        optimos, costo = todos_optimos(finca)
+        assert costo == ordenadas[0][1]
+        assert optimos == [perm for perm, c in todas if c == costo]
+
+
+@pytest.mark.parametrize("modo, n", [("incremental", 8), ("bnb", 11)])
+def test_fuerza_bruta_checkpoint_reanuda(tmp_path, monkeypatch, modo, n):
+    """
+    Una ejecución interrumpida y reanudada desde su checkpoint debe terminar
+    con la misma respuesta que una ejecución sin interrupciones.
+    """
+    random.seed(19)
+    finca = [[random.randint(5, 25), random.randint(1, 5), random.randint(1, 4)]
+             for _ in range(n)]
+    esperado = roFB(finca, mode=modo)
+    ruta = tmp_path / "fb.json"
+
+    guardar_original = fb._guardar_checkpoint
+    escrituras = []
+
+    def guardar_e_interrumpir(archivo, estado):
+        guardar_original(archivo, estado)
+        escrituras.append(estado["cursor"])
+        if len(escrituras) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(fb, "_guardar_checkpoint", guardar_e_interrumpir)
+    with pytest.raises(KeyboardInterrupt):
+        roFB(finca, mode=modo, checkpoint=ruta, intervalo_checkpoint=0)
+    monkeypatch.setattr(fb, "_guardar_checkpoint", guardar_original)
+
+    assert ruta.exists()
+    assert roFB(finca, mode=modo, checkpoint=ruta, resume=True) == esperado
+    assert not ruta.exists()
+
+
+def test_fuerza_bruta_limite_de_tiempo():
+    """
+    Con límite de tiempo, roFB debe devolver una permutación válida, la
+    fracción cubierta y una cota inferior que no supere al óptimo.
+    """
+    random.seed(23)
+    finca = [[random.randint(5, 25), random.randint(1, 5), random.randint(1, 4)]
+             for _ in range(11)]
+
+    inicio = time.time()
+    perm, costo, info = roFB(finca, mode="incremental", time_limit=0.2, reporte=True)
+    duracion = time.time() - inicio
+
+    assert duracion < 2, "El límite de tiempo no detuvo la búsqueda"
+    assert not info["completo"]
+    assert 0 < info["fraccion_explorada"] < 1
+    assert calcular_costo(finca, perm) == costo
+
+    _, optimo, info_bnb = roFB(finca, mode="bnb", reporte=True)
+    assert info_bnb["completo"] and info_bnb["fraccion_explorada"] == 1
+    assert info["cota_inferior"] <= optimo <= costo
@@ -0,0 +1,62 @@
+import random
+import time
+
+from project1_ada2.irrigation_planks_ils import roILS
+from project1_ada2.irrigation_planks_rov import roPV, costo_total
+from project1_ada2.irrigation_plants_pd import roPD
+
+
+def generar_finca(n):
+    """Genera una finca aleatoria con n tablones."""
+    return [[random.randint(5, 6 * n), random.randint(1, 10), random.randint(1, 4)]
+            for _ in range(n)]
+
+
+# ---------------------------------------------------------------------
+# TEST 1: Costo correcto, nunca peor que el voraz, cerca del óptimo
+# ---------------------------------------------------------------------
+def test_ils_calidad():
+    random.seed(24)
+    for _ in range(10):
+        finca = generar_finca(random.randint(1, 12))
+        perm, costo = roILS(finca, tiempo_limite=0.2, semilla=0)
+
+        assert sorted(perm) == list(range(len(finca)))
+        assert costo == costo_total(finca, perm)
+        assert roPD(finca)[1] <= costo <= roPV(finca)[1]
+
+
+# ---------------------------------------------------------------------
+# TEST 2: Presupuesto de tiempo, trayectoria y semilla
+# ---------------------------------------------------------------------
+def test_ils_presupuesto_y_trayectoria():
+    random.seed(25)
+    finca = generar_finca(500)
+
+    inicio = time.perf_counter()
+    perm, costo, trayectoria = roILS(finca, tiempo_limite=0.5, semilla=1, trayectoria=True)
+    assert time.perf_counter() - inicio < 1.5
+
+    segundos = [s for s, _ in trayectoria]
+    costos = [c for _, c in trayectoria]
+    assert segundos == sorted(segundos)
+    assert all(a > b for a, b in zip(costos, costos[1:])), "La trayectoria solo registra mejoras"
+    assert costos[-1] == costo == costo_total(finca, perm)
+
+
+def test_ils_respeta_presupuesto_en_fincas_grandes():
+    # El orden inicial también cuenta dentro del presupuesto
+    random.seed(27)
+    finca = generar_finca(20_000)
+
+    inicio = time.perf_counter()
+    perm, costo = roILS(finca, tiempo_limite=0.5, semilla=2)
+    assert time.perf_counter() - inicio < 1.0
+    assert costo <= roPV(finca)[1]
+
+
+def test_ils_reproducible():
+    random.seed(26)
+    finca = generar_finca(60)
+    resultado = roILS(finca, tiempo_limite=60, semilla=7, max_iteraciones=200)
+    assert roILS(finca, tiempo_limite=60, semilla=7, max_iteraciones=200) == resultado
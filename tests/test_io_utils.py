@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from project1_ada2.io_utils import leer_finca, leer_finca_columnas
+
+
+def escribir(tmp_path, contenido):
+    ruta = tmp_path / "finca.txt"
+    ruta.write_text(contenido)
+    return ruta
+
+
+# ---------------------------------------------------------------------
+# TEST 1: Archivo válido, ambas lecturas coinciden
+# ---------------------------------------------------------------------
+def test_lectura_valida(tmp_path):
+    ruta = escribir(tmp_path, "3\n10,3,4\n5,3,3\n2,2,1\n")
+
+    assert leer_finca(ruta) == [[10, 3, 4], [5, 3, 3], [2, 2, 1]]
+    ts, tr, p = leer_finca_columnas(ruta)
+    assert np.column_stack([ts, tr, p]).tolist() == leer_finca(ruta)
+
+
+# ---------------------------------------------------------------------
+# TEST 2: Menos tablones de los anunciados
+# ---------------------------------------------------------------------
+@pytest.mark.parametrize("contenido", ["2\n", "3\n10,3,4\n5,3,3\n"])
+def test_cantidad_incorrecta(tmp_path, contenido):
+    ruta = escribir(tmp_path, contenido)
+
+    with pytest.raises(Exception, match="Se esperaban"):
+        leer_finca(ruta)
+    with pytest.raises(ValueError, match="tablones"):
+        leer_finca_columnas(ruta)
+
+
+# ---------------------------------------------------------------------
+# TEST 3: Líneas mal formadas o valores fuera de rango
+# ---------------------------------------------------------------------
+@pytest.mark.parametrize("contenido", [
+    "2\n10,3,4\n5,3\n",
+    "1\n10,3\n",
+    "1\n10,a,4\n",
+    "1\n10,3,5\n",
+    "1\n-1,3,2\n",
+])
+def test_lineas_mal_formadas(tmp_path, contenido):
+    ruta = escribir(tmp_path, contenido)
+
+    with pytest.raises(Exception):
+        leer_finca(ruta)
+    with pytest.raises(ValueError):
+        leer_finca_columnas(ruta)
@@ -1,6 +1,6 @@
 import time
 import random
-from project1_ada2.irrigation_plants_pd import roPD, calcular_costo_tab
+from project1_ada2.irrigation_plants_pd import roPD, calcular_costo_tab, SesionPD
 
 def test_programacion_dinamica_basico():
     """
@@ -87,3 +87,116 @@ print(f"Tiempo de ejecución: {duracion:.2f} s")
 
 # En este tamaño el algoritmo puede exceder fácilmente varios minutos; no se usa assert de tiempo
 # sino que se documenta su inviabilidad práctica para n ≥ 20.
+
+
+def test_programacion_dinamica_arreglo_igual_a_memo():
+    """
+    El DP bottom-up indexado por máscara debe devolver la misma permutación
+    y costo que la versión top-down con lru_cache.
+    """
+    random.seed(3)
+    for _ in range(30):
+        n = random.randint(1, 8)
+        finca = [[random.randint(0, 12), random.randint(0, 4), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roPD(finca, mode="arreglo") == roPD(finca, mode="memo")
+
+
+def test_programacion_dinamica_numpy_igual_a_arreglo():
+    """
+    La versión vectorizada por capas debe coincidir con el bucle interpretado.
+    """
+    random.seed(4)
+    for _ in range(30):
+        n = random.randint(1, 9)
+        finca = [[random.randint(0, 15), random.randint(0, 4), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roPD(finca, mode="numpy") == roPD(finca, mode="arreglo")
+
+
+def test_programacion_dinamica_paralelo_igual_a_numpy():
+    """
+    Repartir las capas entre procesos no debe cambiar el resultado.
+    """
+    random.seed(6)
+    for procesos in (1, 3):
+        n = random.randint(6, 10)
+        finca = [[random.randint(0, 20), random.randint(1, 4), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roPD(finca, mode="paralelo", procesos=procesos) == roPD(finca, mode="numpy")
+
+
+def test_programacion_dinamica_disco_igual_a_numpy(tmp_path):
+    """
+    Con las tablas en disco la respuesta debe ser la misma y los archivos
+    temporales deben desaparecer al terminar.
+    """
+    random.seed(8)
+    for _ in range(5):
+        n = random.randint(1, 11)
+        finca = [[random.randint(0, 20), random.randint(0, 4), random.randint(1, 4)]
+                 for _ in range(n)]
+        assert roPD(finca, mode="disco", directorio=tmp_path) == roPD(finca, mode="numpy")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_programacion_dinamica_dos_capas_optima():
+    """
+    El modo de dos capas reconstruye el orden sin tabla de padres: su costo
+    debe ser el óptimo y coincidir con el costo de la permutación devuelta.
+    """
+    random.seed(9)
+    for _ in range(5):
+        n = random.randint(13, 15)
+        finca = [[random.randint(0, 30), random.randint(0, 5), random.randint(1, 4)]
+                 for _ in range(n)]
+        perm, costo = roPD(finca, mode="dos_capas")
+        assert sorted(perm) == list(range(n))
+        assert costo == roPD(finca, mode="numpy")[1]
+        assert costo == calcular_costo_tab(finca, perm)
+
+
+def test_sesion_pd_reutiliza_tabla():
+    """
+    Una sesión que edita, agrega y quita tablones debe dar siempre el mismo
+    costo que resolver desde cero la finca resultante.
+    """
+    random.seed(10)
+    finca = [[random.randint(0, 30), random.randint(0, 5), random.randint(1, 4)] for _ in range(8)]
+    sesion = SesionPD(finca)
+    assert sesion.resolver()[1] == roPD(finca)[1]
+
+    for paso in range(15):
+        tablon = [random.randint(0, 30), random.randint(0, 5), random.randint(1, 4)]
+        if paso % 3 == 0:
+            perm, costo = sesion.actualizar(random.randrange(len(sesion.finca)), tablon)
+        elif paso % 3 == 1:
+            perm, costo = sesion.agregar(tablon)
+        else:
+            perm, costo = sesion.quitar(random.randrange(len(sesion.finca)))
+
+        assert costo == roPD(sesion.finca)[1]
+        assert costo == calcular_costo_tab(sesion.finca, perm)
+
+
+def test_programacion_dinamica_estadisticas():
+    """
+    Las estadísticas de los modos numpy y memo deben describir el mismo
+    espacio de estados y no alterar el resultado.
+    """
+    random.seed(11)
+    n = 9
+    finca = [[random.randint(0, 30), random.randint(1, 5), random.randint(1, 4)] for _ in range(n)]
+
+    perm, costo, stats = roPD(finca, estadisticas=True)
+    assert (perm, costo) == roPD(finca)
+    assert stats["estados"] == 2 ** n
+    assert stats["transiciones"] == n * 2 ** (n - 1)
+    assert sorted(stats["tiempo_por_capa"]) == list(range(n))
+    assert stats["pico_memoria"] > 0
+
+    _, costo_memo, stats_memo = roPD(finca, mode="memo", estadisticas=True)
+    assert costo_memo == costo
+    assert stats_memo["estados"] == stats_memo["fallos_cache"] == 2 ** n
+    assert stats_memo["transiciones"] == stats["transiciones"]
+    assert stats_memo["aciertos_cache"] == stats_memo["transiciones"] - 2 ** n + 1
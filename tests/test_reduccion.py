@@ -0,0 +1,69 @@
+import random
+import time
+
+import numpy as np
+
+from project1_ada2.irrigation_planks_fb import roFB, calcular_costo
+from project1_ada2.irrigation_planks_rov import roPV, costo_orden
+from project1_ada2.irrigation_plants_pd import roPD
+from project1_ada2.reduccion import reducir
+
+
+def generar_finca(n):
+    """Genera una finca aleatoria con n tablones, varios de ellos holgados."""
+    return [[random.randint(0, 40), random.randint(0, 5), random.randint(1, 4)]
+            for _ in range(n)]
+
+
+# ---------------------------------------------------------------------
+# TEST 1: Reglas de fijación
+# ---------------------------------------------------------------------
+def test_reducir_fija_holgados_y_sin_riego():
+    # Suma de tr = 10: el 3 (ts=10) va de último; sin él la suma es 6 y el
+    # 1 (ts=7) también se fija. El 4 no consume tiempo y va primero.
+    finca = [[2, 3, 2], [7, 2, 1], [3, 1, 4], [10, 4, 1], [5, 0, 3]]
+    nucleo, al_principio, al_final = reducir(finca)
+
+    assert al_principio == [4]
+    assert al_final == [1, 3]
+    assert nucleo == [0, 2]
+
+
+# ---------------------------------------------------------------------
+# TEST 2: Los exactos con reducción siguen siendo óptimos; el voraz, válido
+# ---------------------------------------------------------------------
+def test_reduccion_en_los_tres_algoritmos():
+    random.seed(19)
+    for _ in range(30):
+        finca = generar_finca(random.randint(0, 8))
+        optimo = roPD(finca)[1]
+
+        for perm, costo in (roFB(finca, reducir=True), roPD(finca, reducir=True)):
+            assert sorted(perm) == list(range(len(finca)))
+            assert costo == optimo == calcular_costo(finca, perm)
+
+        # El voraz sobre el núcleo no siempre mejora al voraz sobre la finca
+        # completa: solo se comprueba que la respuesta sea válida
+        perm, costo = roPV(finca, reducir=True)
+        assert sorted(perm) == list(range(len(finca)))
+        assert costo == costo_orden(np.array(finca, dtype=np.int64).reshape(-1, 3), perm)
+
+
+# ---------------------------------------------------------------------
+# TEST 3: La reducción es O(n log n) en fincas grandes
+# ---------------------------------------------------------------------
+def test_reduccion_finca_grande():
+    random.seed(20)
+    n = 200_000
+    finca = [[random.randint(0, 6 * n), random.randint(1, 10), random.randint(1, 4)]
+             for _ in range(n)]
+
+    inicio = time.perf_counter()
+    nucleo, al_principio, al_final = reducir(finca)
+    assert time.perf_counter() - inicio < 2.0
+
+    assert sorted(nucleo + al_principio + al_final) == list(range(n))
+    datos = np.array(finca, dtype=np.int64)
+    completo = costo_orden(datos, al_principio + nucleo + al_final)
+    assert completo == costo_orden(datos, al_principio + nucleo), \
+        "Los tablones fijados al final no pagan penalización"
@@ -1,6 +1,12 @@
 import time
 import random
-from project1_ada2.irrigation_planks_rov import roPV, costo_total
+
+import numpy as np
+import pytest
+
+from project1_ada2 import irrigation_planks_rov
+from project1_ada2.irrigation_planks_rov import (roPV, costo_total, busqueda_local, _primera_mejora,
+                                                 portafolio, REGLAS, roPV_columnas)
 
 
 # ---------------------------------------------------------------------
@@ -112,3 +118,108 @@ def test_voraz_rendimiento_grande():
 
     # Tiempo límite ajustable según la máquina
     assert duracion < 10, f"El algoritmo tardó demasiado: {duracion:.2f}s"
+
+
+# ---------------------------------------------------------------------
+# TEST 5: Búsqueda local después del orden voraz
+# ---------------------------------------------------------------------
+def test_voraz_con_busqueda_local():
+    random.seed(21)
+    for _ in range(50):
+        n = random.randint(0, 40)
+        finca = [[random.randint(5, 150), random.randint(1, 10), random.randint(1, 4)] for _ in range(n)]
+
+        _, costo_voraz = roPV(finca)
+        perm, costo = roPV(finca, mejorar=True)
+
+        assert sorted(perm) == list(range(n))
+        assert costo == costo_total(finca, perm), "El costo incremental no coincide con el real"
+        assert costo <= costo_voraz, "La búsqueda local no puede empeorar el orden voraz"
+
+        # Óptimo local: ningún movimiento del vecindario mejora
+        fin = []
+        tiempo = 0
+        for i in perm:
+            tiempo += finca[i][1]
+            fin.append(tiempo)
+        assert all(_primera_mejora(finca, perm, fin, q, 8, 3) is None for q in range(n))
+
+
+def test_busqueda_local_con_pasadas_limitadas():
+    random.seed(22)
+    finca = generar_finca(2000)
+    orden, costo_voraz = roPV(finca)
+
+    perm, costo = busqueda_local(finca, orden, max_pasadas=1)
+    assert costo == costo_total(finca, perm)
+    assert costo <= costo_voraz
+
+
+# ---------------------------------------------------------------------
+# TEST 6: Portafolio de reglas de despacho
+# ---------------------------------------------------------------------
+def test_portafolio_de_reglas():
+    random.seed(23)
+    finca = generar_finca(300)
+
+    # Con solo el cociente se reproduce el voraz original
+    assert roPV(finca, reglas=["cociente"]) == roPV(finca)
+
+    costos = {}
+    for regla in REGLAS:
+        perm, costo = roPV(finca, reglas=[regla])
+        assert sorted(perm) == list(range(len(finca)))
+        assert costo == costo_total(finca, perm)
+        costos[regla] = costo
+
+    perm, costo, ganadora = portafolio(finca)
+    assert costo == min(costos.values()) == costos[ganadora]
+    assert portafolio(finca, procesos=2) == (perm, costo, ganadora)
+
+
+def test_portafolio_admite_tr_cero():
+    finca = [[0, 0, 1], [3, 2, 1], [5, 0, 2]]
+    for regla in REGLAS:
+        perm, costo = roPV(finca, reglas=[regla])
+        assert costo == costo_total(finca, perm)
+
+
+def test_portafolio_valida_reglas(monkeypatch):
+    finca = generar_finca(50)
+    with pytest.raises(ValueError):
+        portafolio(finca, reglas=())
+    with pytest.raises(ValueError):
+        portafolio(finca, reglas=["cociente", "lifo"])
+
+    # En fincas grandes el portafolio por defecto omite mdd y atc
+    monkeypatch.setattr(irrigation_planks_rov, "MAX_TABLONES_DINAMICAS", 10)
+    ganadora = portafolio(finca)[2]
+    assert ganadora not in ("mdd", "atc")
+
+
+# ---------------------------------------------------------------------
+# TEST 7: Motor sobre columnas y tablones sin riego
+# ---------------------------------------------------------------------
+def test_voraz_admite_tr_cero():
+    finca = [[4, 2, 1], [0, 0, 3], [3, 1, 2], [1, 0, 1]]
+    perm, costo = roPV(finca)
+
+    assert perm[:2] == [1, 3], "Los tablones con tr = 0 deben ir primero"
+    assert costo == costo_total(finca, perm)
+
+
+def test_voraz_columnas_un_millon():
+    n = 1_000_000
+    rng = np.random.default_rng(24)
+    ts = rng.integers(5, 5 * n, n)
+    tr = rng.integers(0, 11, n)
+    p = rng.integers(1, 5, n)
+
+    (orden, costo), duracion = medir_tiempo(roPV_columnas, ts, tr, p)
+    imprimir_tiempo("Voraz - columnas", n, duracion)
+
+    assert len(orden) == n
+    muestra = [[int(ts[i]), int(tr[i]), int(p[i])] for i in range(1000)]
+    orden_muestra, costo_muestra = roPV_columnas(ts[:1000], tr[:1000], p[:1000])
+    assert roPV(muestra) == (orden_muestra.tolist(), costo_muestra)
+    assert duracion < 5, f"El voraz sobre columnas tardó demasiado: {duracion:.2f}s"